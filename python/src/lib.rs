@@ -1,135 +1,364 @@
 use mathroborust::lie::LieGroup;
+use mathroborust::so3::{
+    apply_many_raw, exp_raw, hat_commute_raw, hat_raw, normalize_quaternion_raw,
+    quaternion_apply_raw,
+};
 use mathroborust::{Cmtm, Se3, So3};
 use nalgebra::SMatrix;
+use numpy::{PyArray2, PyArrayMethods, PyUntypedArrayMethods};
+use pyo3::exceptions::{PyBufferError, PyValueError};
+use pyo3::ffi;
 use pyo3::prelude::*;
+use pyo3::types::{IntoPyDict, PyFloat, PyTuple};
+use std::ffi::{c_char, c_int, c_void};
+use std::ptr;
+use std::sync::OnceLock;
 
 #[pymodule]
 pub fn mathrobors(module: &Bound<'_, PyModule>) -> PyResult<()> {
+    mathroborust::dispatch::init();
     module.add_class::<PySo3>()?;
     module.add_class::<PySe3>()?;
     module.add_class::<PyCmtm>()?;
     Ok(())
 }
 
-#[pyclass(name = "SO3")]
+/// Copy a square row-major matrix into a new `numpy.ndarray` of shape
+/// `(dim, dim)`. The array is filled with a single memcpy instead of building
+/// one Python list per row and one float object per entry.
+fn matrix_to_pyarray<'py>(
+    py: Python<'py>,
+    data: &[f64],
+    dim: usize,
+) -> PyResult<Bound<'py, PyArray2<f64>>> {
+    debug_assert_eq!(data.len(), dim * dim);
+    unsafe {
+        let array = PyArray2::<f64>::new(py, [dim, dim], false);
+        array.as_slice_mut()?.copy_from_slice(data);
+        Ok(array)
+    }
+}
+
+/// Shape and byte strides of the row-major `f64` matrices exported through the
+/// buffer protocol. They must outlive every exported view, hence the statics.
+static LAYOUT_3: [ffi::Py_ssize_t; 4] = [3, 3, 24, 8];
+static LAYOUT_4: [ffi::Py_ssize_t; 4] = [4, 4, 32, 8];
+static LAYOUT_6: [ffi::Py_ssize_t; 4] = [6, 6, 48, 8];
+
+/// Fill `view` with a read-only, zero-copy description of a row-major matrix
+/// stored inside `owner`. The classes are frozen and their caches are
+/// write-once, so `data` stays valid and unchanged for as long as the view
+/// holds its reference to `owner`.
+unsafe fn fill_matrix_buffer(
+    view: *mut ffi::Py_buffer,
+    flags: c_int,
+    owner: &Bound<'_, PyAny>,
+    data: &[f64],
+    layout: &'static [ffi::Py_ssize_t; 4],
+) -> PyResult<()> {
+    if view.is_null() {
+        return Err(PyBufferError::new_err("buffer view is null"));
+    }
+    if flags & ffi::PyBUF_WRITABLE == ffi::PyBUF_WRITABLE {
+        return Err(PyBufferError::new_err("matrix buffers are read-only"));
+    }
+    if flags & ffi::PyBUF_F_CONTIGUOUS == ffi::PyBUF_F_CONTIGUOUS {
+        return Err(PyBufferError::new_err(
+            "matrix buffers are row-major, not Fortran-contiguous",
+        ));
+    }
+    // Without PyBUF_ND the consumer expects a flat view with no shape, as
+    // `PyBuffer_FillInfo` reports it.
+    let nd = flags & ffi::PyBUF_ND == ffi::PyBUF_ND;
+    unsafe {
+        (*view).obj = owner.clone().into_ptr();
+        (*view).buf = data.as_ptr() as *mut c_void;
+        (*view).len = size_of_val(data) as ffi::Py_ssize_t;
+        (*view).readonly = 1;
+        (*view).itemsize = size_of::<f64>() as ffi::Py_ssize_t;
+        (*view).format = if flags & ffi::PyBUF_FORMAT == ffi::PyBUF_FORMAT {
+            c"d".as_ptr() as *mut c_char
+        } else {
+            ptr::null_mut()
+        };
+        (*view).ndim = if nd { 2 } else { 1 };
+        (*view).shape = if nd {
+            layout.as_ptr() as *mut ffi::Py_ssize_t
+        } else {
+            ptr::null_mut()
+        };
+        (*view).strides = if flags & ffi::PyBUF_STRIDES == ffi::PyBUF_STRIDES {
+            layout.as_ptr().add(2) as *mut ffi::Py_ssize_t
+        } else {
+            ptr::null_mut()
+        };
+        (*view).suboffsets = ptr::null_mut();
+        (*view).internal = ptr::null_mut();
+    }
+    Ok(())
+}
+
+/// Shared body of the `__array__` methods: a fresh array, converted to the
+/// requested dtype if one is given. `copy=False` cannot be honoured here;
+/// NumPy takes the zero-copy buffer-protocol path before falling back to
+/// `__array__`.
+fn array_protocol<'py>(
+    array: Bound<'py, PyArray2<f64>>,
+    dtype: Option<Bound<'py, PyAny>>,
+    copy: Option<bool>,
+) -> PyResult<Bound<'py, PyAny>> {
+    if copy == Some(false) {
+        return Err(PyValueError::new_err(
+            "unable to avoid a copy in __array__; use the buffer protocol instead",
+        ));
+    }
+    match dtype {
+        Some(dtype) => array.call_method1("astype", (dtype,)),
+        None => Ok(array.into_any()),
+    }
+}
+
+/// Extract a 3-vector argument. Tuples of floats, the calling convention used
+/// throughout the Python API, are read directly from the tuple slots; any
+/// other input (lists, ints, NumPy arrays) goes through the generic sequence
+/// conversion.
+fn extract_vec3(obj: &Bound<'_, PyAny>) -> PyResult<[f64; 3]> {
+    if let Ok(tuple) = obj.downcast::<PyTuple>() {
+        if tuple.len() == 3 {
+            let mut out = [0.0_f64; 3];
+            for (i, slot) in out.iter_mut().enumerate() {
+                let item = unsafe { tuple.get_borrowed_item_unchecked(i) };
+                match item.downcast::<PyFloat>() {
+                    Ok(value) => *slot = value.value(),
+                    Err(_) => return obj.extract(),
+                }
+            }
+            return Ok(out);
+        }
+    }
+    obj.extract()
+}
+
+/// Extract an `N×N` matrix argument. Float64 NumPy arrays, which is what
+/// `hat()` and `matrix()` return, are read straight from the array data; any
+/// other input (nested lists or tuples, other dtypes) goes through the generic
+/// sequence conversion.
+fn extract_matrix<const N: usize>(obj: &Bound<'_, PyAny>) -> PyResult<[[f64; N]; N]> {
+    if let Ok(array) = obj.downcast::<PyArray2<f64>>() {
+        if let Ok(array) = array.try_readonly() {
+            let view = array.as_array();
+            if view.dim() == (N, N) {
+                return Ok(std::array::from_fn(|r| {
+                    std::array::from_fn(|c| view[[r, c]])
+                }));
+            }
+        }
+    }
+    obj.extract()
+}
+
+fn extract_mat3(obj: &Bound<'_, PyAny>) -> PyResult<[[f64; 3]; 3]> {
+    extract_matrix(obj)
+}
+
+fn extract_mat4(obj: &Bound<'_, PyAny>) -> PyResult<[[f64; 4]; 4]> {
+    extract_matrix(obj)
+}
+
+/// Python `SO3` wrapper. Instances are immutable (every operation returns a
+/// new object), so derived representations are computed at most once.
+#[pyclass(name = "SO3", frozen)]
 pub struct PySo3 {
     inner: So3,
+    quaternion: OnceLock<[f64; 4]>,
+}
+
+impl From<So3> for PySo3 {
+    fn from(inner: So3) -> Self {
+        Self {
+            inner,
+            quaternion: OnceLock::new(),
+        }
+    }
 }
 
 #[pymethods]
 impl PySo3 {
     #[new]
     pub fn new() -> Self {
-        Self {
-            inner: So3::identity(),
-        }
+        Self::from(So3::identity())
     }
 
     #[staticmethod]
-    pub fn from_axis_angle(axis: [f64; 3], angle: f64) -> Self {
+    pub fn from_axis_angle(
+        #[pyo3(from_py_with = "extract_vec3")] axis: [f64; 3],
+        angle: f64,
+    ) -> Self {
+        // The half-angle quaternion is built on the way to the matrix anyway,
+        // so seed the cache with it.
+        let (inner, quaternion) = So3::from_axis_angle_with_quaternion(axis, angle);
         Self {
-            inner: So3::from_axis_angle(axis, angle),
+            inner,
+            quaternion: OnceLock::from(quaternion),
         }
     }
 
     #[staticmethod]
     pub fn from_quaternion(quaternion: [f64; 4]) -> Self {
-        Self {
-            inner: So3::from_quaternion(quaternion),
-        }
+        Self::from(So3::from_quaternion(quaternion))
     }
 
     #[staticmethod]
-    pub fn quaternion_to_mat(quaternion: [f64; 4]) -> [[f64; 3]; 3] {
-        So3::from_quaternion(quaternion).to_matrix()
+    pub fn quaternion_to_mat<'py>(
+        py: Python<'py>,
+        quaternion: [f64; 4],
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        matrix_to_pyarray(py, So3::from_quaternion(quaternion).row_major(), 3)
     }
 
     #[staticmethod]
     pub fn set_quaternion(quaternion: [f64; 4]) -> Self {
-        Self {
-            inner: So3::from_quaternion(quaternion),
-        }
+        Self::from(So3::from_quaternion(quaternion))
     }
 
     #[staticmethod]
     pub fn from_euler_angles(roll: f64, pitch: f64, yaw: f64) -> Self {
-        Self {
-            inner: So3::from_euler_angles(roll, pitch, yaw),
-        }
+        Self::from(So3::from_euler_angles(roll, pitch, yaw))
     }
 
     #[staticmethod]
-    pub fn set_euler(euler: (f64, f64, f64)) -> Self {
-        Self {
-            inner: So3::from_euler_angles(euler.0, euler.1, euler.2),
-        }
+    pub fn set_euler(#[pyo3(from_py_with = "extract_vec3")] euler: [f64; 3]) -> Self {
+        let [roll, pitch, yaw] = euler;
+        Self::from(So3::from_euler_angles(roll, pitch, yaw))
     }
 
     #[staticmethod]
-    pub fn from_rotation_vector(vector: [f64; 3]) -> Self {
-        Self {
-            inner: So3::from_rotation_vector(vector),
-        }
+    pub fn from_rotation_vector(#[pyo3(from_py_with = "extract_vec3")] vector: [f64; 3]) -> Self {
+        Self::from(So3::from_rotation_vector(vector))
     }
 
     #[staticmethod]
     #[pyo3(signature = (vector, a=None))]
-    pub fn exp(vector: [f64; 3], a: Option<f64>) -> [[f64; 3]; 3] {
+    pub fn exp<'py>(
+        py: Python<'py>,
+        #[pyo3(from_py_with = "extract_vec3")] vector: [f64; 3],
+        a: Option<f64>,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
         let scale = a.unwrap_or(1.0);
         let scaled = [vector[0] * scale, vector[1] * scale, vector[2] * scale];
-        So3::from_rotation_vector(scaled).to_matrix()
+        matrix_to_pyarray(py, &exp_raw(scaled), 3)
     }
 
     #[staticmethod]
     #[pyo3(signature = (vector, a=None))]
-    pub fn exp_adj(vector: [f64; 3], a: Option<f64>) -> [[f64; 3]; 3] {
-        PySo3::exp(vector, a)
+    pub fn exp_adj<'py>(
+        py: Python<'py>,
+        #[pyo3(from_py_with = "extract_vec3")] vector: [f64; 3],
+        a: Option<f64>,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        PySo3::exp(py, vector, a)
     }
 
-    pub fn apply(&self, vector: [f64; 3]) -> [f64; 3] {
+    pub fn apply(&self, #[pyo3(from_py_with = "extract_vec3")] vector: [f64; 3]) -> [f64; 3] {
         self.inner.apply(vector)
     }
 
+    /// Rotate a vector by a quaternion `[w, x, y, z]` without building a
+    /// rotation matrix. The quaternion is normalized first, as in
+    /// `set_quaternion`.
     #[staticmethod]
-    pub fn hat(vector: [f64; 3]) -> [[f64; 3]; 3] {
-        So3::hat(vector)
+    pub fn quaternion_apply(
+        quaternion: [f64; 4],
+        #[pyo3(from_py_with = "extract_vec3")] vector: [f64; 3],
+    ) -> [f64; 3] {
+        quaternion_apply_raw(normalize_quaternion_raw(quaternion), vector)
+    }
+
+    /// Rotate every row of an `(N, 3)` array with one kernel call. Float64
+    /// arrays are read in place; any other input (int or float32 arrays,
+    /// nested lists) is converted with `numpy.asarray(points, dtype=float)`.
+    pub fn apply_many<'py>(
+        &self,
+        py: Python<'py>,
+        points: &Bound<'py, PyAny>,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        let array = match points.downcast::<PyArray2<f64>>() {
+            Ok(array) => array.clone(),
+            Err(_) => {
+                let kwargs = [("dtype", py.get_type::<PyFloat>())].into_py_dict(py)?;
+                let numpy = py.import("numpy")?;
+                let converted = numpy.call_method("asarray", (points,), Some(&kwargs))?;
+                let shape = converted.getattr("shape")?;
+                converted.downcast_into::<PyArray2<f64>>().map_err(|_| {
+                    PyValueError::new_err(format!("expected an array of shape (N, 3), got {shape}"))
+                })?
+            }
+        };
+        let points = array.try_readonly()?;
+        let shape = points.shape();
+        if shape[1] != 3 {
+            return Err(PyValueError::new_err(format!(
+                "expected an array of shape (N, 3), got {shape:?}"
+            )));
+        }
+        let rotated = unsafe { PyArray2::<f64>::new(py, [shape[0], 3], false) };
+        let out = unsafe { rotated.as_slice_mut()? };
+        match points.as_slice() {
+            Ok(flat) if points.is_c_contiguous() => {
+                apply_many_raw(self.inner.row_major(), flat, out)
+            }
+            _ => {
+                let flat: Vec<f64> = points.as_array().iter().copied().collect();
+                apply_many_raw(self.inner.row_major(), &flat, out);
+            }
+        }
+        Ok(rotated)
     }
 
     #[staticmethod]
-    pub fn hat_commute(vector: [f64; 3]) -> [[f64; 3]; 3] {
-        let mut hat = So3::hat(vector);
-        for r in 0..3 {
-            for c in 0..3 {
-                hat[r][c] = -hat[r][c];
-            }
-        }
-        hat
+    pub fn hat<'py>(
+        py: Python<'py>,
+        #[pyo3(from_py_with = "extract_vec3")] vector: [f64; 3],
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        matrix_to_pyarray(py, &hat_raw(vector), 3)
+    }
+
+    #[staticmethod]
+    pub fn hat_commute<'py>(
+        py: Python<'py>,
+        #[pyo3(from_py_with = "extract_vec3")] vector: [f64; 3],
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        matrix_to_pyarray(py, &hat_commute_raw(vector), 3)
     }
 
     #[staticmethod]
-    pub fn hat_adj(vector: [f64; 3]) -> [[f64; 3]; 3] {
-        So3::hat(vector)
+    pub fn hat_adj<'py>(
+        py: Python<'py>,
+        #[pyo3(from_py_with = "extract_vec3")] vector: [f64; 3],
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        PySo3::hat(py, vector)
     }
 
     #[staticmethod]
-    pub fn hat_commute_adj(vector: [f64; 3]) -> [[f64; 3]; 3] {
-        PySo3::hat_commute(vector)
+    pub fn hat_commute_adj<'py>(
+        py: Python<'py>,
+        #[pyo3(from_py_with = "extract_vec3")] vector: [f64; 3],
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        PySo3::hat_commute(py, vector)
     }
 
     #[staticmethod]
-    pub fn vee(matrix: [[f64; 3]; 3]) -> [f64; 3] {
+    pub fn vee(#[pyo3(from_py_with = "extract_mat3")] matrix: [[f64; 3]; 3]) -> [f64; 3] {
         So3::vee(matrix)
     }
 
     #[staticmethod]
-    pub fn vee_adj(matrix: [[f64; 3]; 3]) -> [f64; 3] {
+    pub fn vee_adj(#[pyo3(from_py_with = "extract_mat3")] matrix: [[f64; 3]; 3]) -> [f64; 3] {
         So3::vee(matrix)
     }
 
     pub fn compose(&self, other: &PySo3) -> PySo3 {
-        PySo3 {
-            inner: self.inner.compose(&other.inner),
-        }
+        PySo3::from(self.inner.compose(&other.inner))
     }
 
     #[pyo3(name = "__mul__")]
@@ -138,62 +367,82 @@ impl PySo3 {
     }
 
     pub fn inverse(&self) -> PySo3 {
-        PySo3 {
-            inner: self.inner.inverse(),
-        }
+        PySo3::from(self.inner.inverse())
     }
 
     pub fn inv(&self) -> PySo3 {
         self.inverse()
     }
 
-    pub fn matrix(&self) -> [[f64; 3]; 3] {
-        self.inner.to_matrix()
+    pub fn matrix<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        matrix_to_pyarray(py, self.inner.row_major(), 3)
+    }
+
+    #[pyo3(signature = (dtype=None, copy=None))]
+    pub fn __array__<'py>(
+        &self,
+        py: Python<'py>,
+        dtype: Option<Bound<'py, PyAny>>,
+        copy: Option<bool>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        array_protocol(self.matrix(py)?, dtype, copy)
+    }
+
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        unsafe {
+            fill_matrix_buffer(
+                view,
+                flags,
+                slf.as_any(),
+                slf.get().inner.row_major(),
+                &LAYOUT_3,
+            )
+        }
     }
 
-    pub fn mat(&self) -> [[f64; 3]; 3] {
-        self.inner.to_matrix()
+    pub fn mat<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        self.matrix(py)
     }
 
     #[staticmethod]
-    pub fn set_mat(matrix: [[f64; 3]; 3]) -> Self {
-        Self {
-            inner: So3::from_matrix(matrix),
-        }
+    pub fn set_mat(#[pyo3(from_py_with = "extract_mat3")] matrix: [[f64; 3]; 3]) -> Self {
+        Self::from(So3::from_matrix(matrix))
     }
 
     #[staticmethod]
-    pub fn set_mat_adj(matrix: [[f64; 3]; 3]) -> Self {
-        Self {
-            inner: So3::from_matrix(matrix),
-        }
+    pub fn set_mat_adj(#[pyo3(from_py_with = "extract_mat3")] matrix: [[f64; 3]; 3]) -> Self {
+        Self::from(So3::from_matrix(matrix))
     }
 
     #[staticmethod]
     pub fn eye() -> Self {
-        Self {
-            inner: So3::identity(),
-        }
+        Self::from(So3::identity())
     }
 
-    pub fn mat_inv(&self) -> [[f64; 3]; 3] {
-        self.inner.inverse().to_matrix()
+    pub fn mat_inv<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        matrix_to_pyarray(py, self.inner.inverse().row_major(), 3)
     }
 
-    pub fn mat_adj(&self) -> [[f64; 3]; 3] {
-        self.inner.to_matrix()
+    pub fn mat_adj<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        self.matrix(py)
     }
 
-    pub fn mat_inv_adj(&self) -> [[f64; 3]; 3] {
-        self.inner.inverse().to_matrix()
+    pub fn mat_inv_adj<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        self.mat_inv(py)
     }
 
     pub fn quaternion(&self) -> [f64; 4] {
-        self.inner.to_quaternion()
+        *self.quaternion.get_or_init(|| self.inner.to_quaternion())
     }
 
     #[staticmethod]
-    pub fn mat_to_quaternion(matrix: [[f64; 3]; 3]) -> [f64; 4] {
+    pub fn mat_to_quaternion(
+        #[pyo3(from_py_with = "extract_mat3")] matrix: [[f64; 3]; 3],
+    ) -> [f64; 4] {
         So3::from_matrix(matrix).to_quaternion()
     }
 
@@ -206,65 +455,84 @@ impl PySo3 {
     }
 }
 
-#[pyclass(name = "SE3")]
+/// Python `SE3` wrapper caching its 4×4 homogeneous matrix.
+#[pyclass(name = "SE3", frozen)]
 pub struct PySe3 {
     inner: Se3,
+    matrix: OnceLock<[f64; 16]>,
+}
+
+impl From<Se3> for PySe3 {
+    fn from(inner: Se3) -> Self {
+        Self {
+            inner,
+            matrix: OnceLock::new(),
+        }
+    }
+}
+
+impl PySe3 {
+    fn cached_matrix(&self) -> &[f64; 16] {
+        self.matrix
+            .get_or_init(|| self.inner.to_matrix().as_flattened().try_into().unwrap())
+    }
 }
 
 #[pymethods]
 impl PySe3 {
     #[new]
     pub fn new() -> Self {
-        Self {
-            inner: Se3::identity(),
-        }
+        Self::from(Se3::identity())
     }
 
     #[staticmethod]
-    pub fn from_axis_angle_translation(axis: [f64; 3], angle: f64, translation: [f64; 3]) -> Self {
-        Self {
-            inner: Se3::from_axis_angle_translation(axis, angle, translation),
-        }
+    pub fn from_axis_angle_translation(
+        #[pyo3(from_py_with = "extract_vec3")] axis: [f64; 3],
+        angle: f64,
+        #[pyo3(from_py_with = "extract_vec3")] translation: [f64; 3],
+    ) -> Self {
+        Self::from(Se3::from_axis_angle_translation(axis, angle, translation))
     }
 
     #[staticmethod]
-    pub fn from_parts(rotation: &PySo3, translation: [f64; 3]) -> Self {
-        Self {
-            inner: Se3::from_parts(rotation.inner.clone(), translation),
-        }
+    pub fn from_parts(
+        rotation: &PySo3,
+        #[pyo3(from_py_with = "extract_vec3")] translation: [f64; 3],
+    ) -> Self {
+        Self::from(Se3::from_parts(rotation.inner.clone(), translation))
     }
 
     #[staticmethod]
-    pub fn from_matrix(matrix: [[f64; 4]; 4]) -> Self {
-        Self {
-            inner: Se3::from_matrix(matrix),
-        }
+    pub fn from_matrix(#[pyo3(from_py_with = "extract_mat4")] matrix: [[f64; 4]; 4]) -> Self {
+        Self::from(Se3::from_matrix(matrix))
     }
 
     #[staticmethod]
-    pub fn hat(twist: [f64; 6]) -> [[f64; 4]; 4] {
-        Se3::hat(twist)
+    pub fn hat<'py>(py: Python<'py>, twist: [f64; 6]) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        matrix_to_pyarray(py, Se3::hat(twist).as_flattened(), 4)
     }
 
     #[staticmethod]
-    pub fn vee(matrix: [[f64; 4]; 4]) -> [f64; 6] {
+    pub fn vee(#[pyo3(from_py_with = "extract_mat4")] matrix: [[f64; 4]; 4]) -> [f64; 6] {
         Se3::vee(matrix)
     }
 
     #[staticmethod]
     #[pyo3(signature = (twist, a=None))]
-    pub fn exp(twist: [f64; 6], a: Option<f64>) -> [[f64; 4]; 4] {
-        Se3::exp(twist, a)
+    pub fn exp<'py>(
+        py: Python<'py>,
+        twist: [f64; 6],
+        a: Option<f64>,
+    ) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        matrix_to_pyarray(py, Se3::exp(twist, a).as_flattened(), 4)
     }
 
-    pub fn apply(&self, point: [f64; 3]) -> [f64; 3] {
+    pub fn apply(&self, #[pyo3(from_py_with = "extract_vec3")] point: [f64; 3]) -> [f64; 3] {
         self.inner.apply(point)
     }
 
     pub fn compose(&self, other: &PySe3) -> PySe3 {
-        PySe3 {
-            inner: self.inner.compose(&other.inner),
-        }
+        PySe3::from(self.inner.compose(&other.inner))
     }
 
     #[pyo3(name = "__mul__")]
@@ -273,49 +541,69 @@ impl PySe3 {
     }
 
     pub fn inverse(&self) -> PySe3 {
-        PySe3 {
-            inner: self.inner.inverse(),
-        }
+        PySe3::from(self.inner.inverse())
     }
 
     pub fn inv(&self) -> PySe3 {
         self.inverse()
     }
 
-    pub fn matrix(&self) -> [[f64; 4]; 4] {
-        self.inner.to_matrix()
+    pub fn matrix<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        matrix_to_pyarray(py, self.cached_matrix(), 4)
+    }
+
+    #[pyo3(signature = (dtype=None, copy=None))]
+    pub fn __array__<'py>(
+        &self,
+        py: Python<'py>,
+        dtype: Option<Bound<'py, PyAny>>,
+        copy: Option<bool>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        array_protocol(self.matrix(py)?, dtype, copy)
+    }
+
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        unsafe {
+            fill_matrix_buffer(
+                view,
+                flags,
+                slf.as_any(),
+                slf.get().cached_matrix(),
+                &LAYOUT_4,
+            )
+        }
     }
 
-    pub fn mat(&self) -> [[f64; 4]; 4] {
-        self.inner.to_matrix()
+    pub fn mat<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        self.matrix(py)
     }
 
     #[staticmethod]
-    pub fn set_mat(matrix: [[f64; 4]; 4]) -> Self {
-        Self {
-            inner: Se3::from_matrix(matrix),
-        }
+    pub fn set_mat(#[pyo3(from_py_with = "extract_mat4")] matrix: [[f64; 4]; 4]) -> Self {
+        Self::from(Se3::from_matrix(matrix))
     }
 
     #[staticmethod]
     pub fn eye() -> Self {
-        Self {
-            inner: Se3::identity(),
-        }
+        Self::from(Se3::identity())
     }
 
-    pub fn mat_inv(&self) -> [[f64; 4]; 4] {
-        self.inner.inverse().to_matrix()
+    pub fn mat_inv<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        matrix_to_pyarray(py, self.inner.inverse().to_matrix().as_flattened(), 4)
     }
 
-    pub fn mat_adj(&self) -> [[f64; 6]; 6] {
+    pub fn mat_adj<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<f64>>> {
         let adjoint = self.inner.adjoint();
-        s_matrix6_to_array(&adjoint)
+        matrix_to_pyarray(py, s_matrix6_to_array(&adjoint).as_flattened(), 6)
     }
 
-    pub fn mat_inv_adj(&self) -> [[f64; 6]; 6] {
+    pub fn mat_inv_adj<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<f64>>> {
         let adjoint = self.inner.inverse().adjoint();
-        s_matrix6_to_array(&adjoint)
+        matrix_to_pyarray(py, s_matrix6_to_array(&adjoint).as_flattened(), 6)
     }
 
     pub fn translation(&self) -> [f64; 3] {
@@ -323,9 +611,7 @@ impl PySe3 {
     }
 
     pub fn rotation(&self) -> PySo3 {
-        PySo3 {
-            inner: self.inner.rotation().clone(),
-        }
+        PySo3::from(self.inner.rotation().clone())
     }
 }
 
@@ -339,39 +625,78 @@ fn s_matrix6_to_array(matrix: &SMatrix<f64, 6, 6>) -> [[f64; 6]; 6] {
     out
 }
 
-#[pyclass(name = "CMTM")]
+/// Python `CMTM` wrapper caching the row-major copy of its (column-major)
+/// nalgebra matrix.
+#[pyclass(name = "CMTM", frozen)]
 pub struct PyCmtm {
     inner: Cmtm,
+    matrix: OnceLock<[f64; 36]>,
+}
+
+impl From<Cmtm> for PyCmtm {
+    fn from(inner: Cmtm) -> Self {
+        Self {
+            inner,
+            matrix: OnceLock::new(),
+        }
+    }
+}
+
+impl PyCmtm {
+    fn cached_matrix(&self) -> &[f64; 36] {
+        self.matrix
+            .get_or_init(|| self.inner.to_matrix().as_flattened().try_into().unwrap())
+    }
 }
 
 #[pymethods]
 impl PyCmtm {
     #[new]
     pub fn new() -> Self {
-        Self {
-            inner: Cmtm::identity(),
-        }
+        Self::from(Cmtm::identity())
     }
 
     #[staticmethod]
     pub fn from_se3(transform: &PySe3) -> Self {
-        Self {
-            inner: Cmtm::from_se3(&transform.inner),
-        }
+        Self::from(Cmtm::from_se3(&transform.inner))
     }
 
     pub fn apply_twist(&self, twist: [f64; 6]) -> [f64; 6] {
         self.inner.apply_twist(twist)
     }
 
-    pub fn matrix(&self) -> [[f64; 6]; 6] {
-        self.inner.to_matrix()
+    pub fn matrix<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<f64>>> {
+        matrix_to_pyarray(py, self.cached_matrix(), 6)
+    }
+
+    #[pyo3(signature = (dtype=None, copy=None))]
+    pub fn __array__<'py>(
+        &self,
+        py: Python<'py>,
+        dtype: Option<Bound<'py, PyAny>>,
+        copy: Option<bool>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        array_protocol(self.matrix(py)?, dtype, copy)
+    }
+
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        unsafe {
+            fill_matrix_buffer(
+                view,
+                flags,
+                slf.as_any(),
+                slf.get().cached_matrix(),
+                &LAYOUT_6,
+            )
+        }
     }
 
     pub fn compose(&self, other: &PyCmtm) -> PyCmtm {
-        PyCmtm {
-            inner: self.inner.compose(&other.inner),
-        }
+        PyCmtm::from(self.inner.compose(&other.inner))
     }
 
     #[pyo3(name = "__mul__")]
@@ -0,0 +1,8 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def mr():
+    """The pure-Python ``mathrobo`` reference, imported once per session.
+    Tests that request it are skipped when it is not installed."""
+    return pytest.importorskip("mathrobo")
@@ -0,0 +1,5 @@
+import numpy as np
+
+
+def approx_eq(a, b, tol=1e-12):
+    np.testing.assert_allclose(np.asarray(a), np.asarray(b), rtol=0, atol=tol)
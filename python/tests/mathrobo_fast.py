@@ -0,0 +1,75 @@
+"""Numba-compiled reference kernels for the SO(3) benchmarks.
+
+``mathrobo`` builds every result through NumPy calls. At 3-element sizes that
+overhead dominates, so comparing against it alone flatters ``mathrobors``.
+These JIT-compiled versions of the benchmarked functions give a
+compiled-Python baseline that follows the same formulas as the Rust kernels.
+"""
+
+import math
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def so3_exp(v):
+    x, y, z = v[0], v[1], v[2]
+    theta2 = x * x + y * y + z * z
+    if theta2 < 1e-8:
+        a = 1.0 - theta2 / 6.0
+        b = 0.5 - theta2 / 24.0
+    else:
+        theta = math.sqrt(theta2)
+        a = math.sin(theta) / theta
+        b = (1.0 - math.cos(theta)) / theta2
+
+    r = np.empty((3, 3))
+    r[0, 0] = 1.0 - b * (y * y + z * z)
+    r[0, 1] = b * x * y - a * z
+    r[0, 2] = b * x * z + a * y
+    r[1, 0] = b * x * y + a * z
+    r[1, 1] = 1.0 - b * (x * x + z * z)
+    r[1, 2] = b * y * z - a * x
+    r[2, 0] = b * x * z - a * y
+    r[2, 1] = b * y * z + a * x
+    r[2, 2] = 1.0 - b * (x * x + y * y)
+    return r
+
+
+@njit(cache=True, fastmath=True)
+def hat(v):
+    m = np.zeros((3, 3))
+    m[0, 1] = -v[2]
+    m[0, 2] = v[1]
+    m[1, 0] = v[2]
+    m[1, 2] = -v[0]
+    m[2, 0] = -v[1]
+    m[2, 1] = v[0]
+    return m
+
+
+@njit(cache=True, fastmath=True)
+def hat_commute(v):
+    m = np.zeros((3, 3))
+    m[0, 1] = v[2]
+    m[0, 2] = -v[1]
+    m[1, 0] = -v[2]
+    m[1, 2] = v[0]
+    m[2, 0] = v[1]
+    m[2, 1] = -v[0]
+    return m
+
+
+@njit(cache=True, fastmath=True)
+def vee(m):
+    v = np.empty(3)
+    v[0] = 0.5 * (m[2, 1] - m[1, 2])
+    v[1] = 0.5 * (m[0, 2] - m[2, 0])
+    v[2] = 0.5 * (m[1, 0] - m[0, 1])
+    return v
+
+
+@njit(cache=True, fastmath=True)
+def eye():
+    return np.eye(3)
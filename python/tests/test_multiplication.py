@@ -1,25 +1,6 @@
 import math
 import mathrobors
-
-
-def approx_eq(iter_a, iter_b, tol=1e-12):
-    for x, y in zip(iter_a, iter_b):
-        assert abs(x - y) < tol, f"expected {y}, got {x}"
-
-
-def approx_eq_matrix3(a, b, tol=1e-12):
-    for r in range(3):
-        approx_eq(a[r], b[r], tol)
-
-
-def approx_eq_matrix4(a, b, tol=1e-12):
-    for r in range(4):
-        approx_eq(a[r], b[r], tol)
-
-
-def approx_eq_matrix6(a, b, tol=1e-12):
-    for r in range(6):
-        approx_eq(a[r], b[r], tol)
+from helpers import approx_eq
 
 
 def test_so3_mul_matches_compose_and_apply():
@@ -29,7 +10,7 @@ def test_so3_mul_matches_compose_and_apply():
     via_mul = left * right
     via_compose = left.compose(right)
 
-    approx_eq_matrix3(via_mul.matrix(), via_compose.matrix(), 1e-12)
+    approx_eq(via_mul.matrix(), via_compose.matrix(), 1e-12)
     approx_eq(
         via_mul.apply((0.5, -0.25, 1.0)),
         via_compose.apply((0.5, -0.25, 1.0)),
@@ -47,7 +28,7 @@ def test_se3_mul_matches_compose_and_apply():
     via_mul = left * right
     via_compose = left.compose(right)
 
-    approx_eq_matrix4(via_mul.matrix(), via_compose.matrix(), 1e-12)
+    approx_eq(via_mul.matrix(), via_compose.matrix(), 1e-12)
     approx_eq(
         via_mul.apply((0.25, 0.5, -1.0)),
         via_compose.apply((0.25, 0.5, -1.0)),
@@ -69,4 +50,4 @@ def test_cmtm_mul_matches_compose_matrix():
     via_mul = left * right
     via_compose = left.compose(right)
 
-    approx_eq_matrix6(via_mul.matrix(), via_compose.matrix(), 1e-12)
+    approx_eq(via_mul.matrix(), via_compose.matrix(), 1e-12)
@@ -1,28 +1,8 @@
 import math
+import numpy as np
 import pytest
 import mathrobors
-
-
-def approx_eq(a, b, tol=1e-12):
-    assert len(a) == len(b)
-    for x, y in zip(a, b):
-        assert abs(x - y) < tol, f"expected {y}, got {x}"
-
-
-def approx_eq_matrix(a, b, tol=1e-12):
-    for r in range(3):
-        for c in range(3):
-            x = a[r][c]
-            y = b[r][c]
-            assert abs(x - y) < tol, f"expected {y}, got {x} at ({r},{c})"
-
-
-def approx_eq_matrix4(a, b, tol=1e-12):
-    for r in range(4):
-        for c in range(4):
-            x = a[r][c]
-            y = b[r][c]
-            assert abs(x - y) < tol, f"expected {y}, got {x} at ({r},{c})"
+from helpers import approx_eq
 
 
 def test_python_interface_produces_same_values():
@@ -46,7 +26,7 @@ def test_quaternion_roundtrip_preserves_matrix():
     quat = rotation.quaternion()
     rebuilt = mathrobors.SO3.set_quaternion(quat)
 
-    approx_eq_matrix(rotation.matrix(), rebuilt.matrix(), 1e-12)
+    approx_eq(rotation.matrix(), rebuilt.matrix(), 1e-12)
 
 
 def test_hat_and_vee_functions_roundtrip_vector():
@@ -75,7 +55,7 @@ def test_se3_exp_with_pure_translation_matches_expected():
         (0.0, 0.0, 0.0, 1.0),
     )
 
-    approx_eq_matrix4(exp, expected, 1e-12)
+    approx_eq(exp, expected, 1e-12)
 
 
 def test_se3_from_matrix_round_trip():
@@ -84,55 +64,155 @@ def test_se3_from_matrix_round_trip():
     matrix = transform.matrix()
     rebuilt = mathrobors.SE3.from_matrix(matrix)
 
-    approx_eq_matrix4(matrix, rebuilt.matrix(), 1e-12)
-    approx_eq_matrix(rotation.matrix(), rebuilt.rotation().matrix(), 1e-12)
+    approx_eq(matrix, rebuilt.matrix(), 1e-12)
+    approx_eq(rotation.matrix(), rebuilt.rotation().matrix(), 1e-12)
     approx_eq(transform.translation(), rebuilt.translation(), 1e-12)
 
 
 def test_python_functions_match_original_names():
     rotation = mathrobors.SO3.set_euler((0.1, -0.2, 0.3))
-    approx_eq_matrix(rotation.mat(), rotation.matrix(), 1e-12)
-    approx_eq_matrix(rotation.mat_inv(), rotation.inverse().matrix(), 1e-12)
-    approx_eq_matrix(rotation.mat_adj(), rotation.matrix(), 1e-12)
-    approx_eq_matrix(rotation.mat_inv_adj(), rotation.inverse().matrix(), 1e-12)
+    approx_eq(rotation.mat(), rotation.matrix(), 1e-12)
+    approx_eq(rotation.mat_inv(), rotation.inverse().matrix(), 1e-12)
+    approx_eq(rotation.mat_adj(), rotation.matrix(), 1e-12)
+    approx_eq(rotation.mat_inv_adj(), rotation.inverse().matrix(), 1e-12)
 
     quat = rotation.quaternion()
-    approx_eq_matrix(mathrobors.SO3.quaternion_to_mat(quat), rotation.matrix(), 1e-12)
+    approx_eq(mathrobors.SO3.quaternion_to_mat(quat), rotation.matrix(), 1e-12)
     approx_eq(mathrobors.SO3.mat_to_quaternion(rotation.matrix()), quat, 1e-12)
 
     identity = mathrobors.SO3.eye()
-    approx_eq_matrix(identity.mat(), mathrobors.SO3.set_mat(identity.matrix()).matrix(), 1e-12)
+    approx_eq(identity.mat(), mathrobors.SO3.set_mat(identity.matrix()).matrix(), 1e-12)
 
     hat = mathrobors.SO3.hat((0.2, 0.3, 0.4))
     commute = mathrobors.SO3.hat_commute((0.2, 0.3, 0.4))
-    for r in range(3):
-        for c in range(3):
-            assert hat[r][c] == -commute[r][c]
+    np.testing.assert_array_equal(hat, -commute)
 
     vee_adj = mathrobors.SO3.vee_adj(hat)
     approx_eq(vee_adj, (0.2, 0.3, 0.4), 1e-12)
 
     exp_matrix = mathrobors.SO3.exp((0.1, -0.2, 0.3), None)
-    approx_eq_matrix(exp_matrix, mathrobors.SO3.from_rotation_vector((0.1, -0.2, 0.3)).matrix(), 1e-12)
+    approx_eq(exp_matrix, mathrobors.SO3.from_rotation_vector((0.1, -0.2, 0.3)).matrix(), 1e-12)
 
-@pytest.mark.dev
-def test_compare_mathrobo():
-    import mathrobo as mr
-    import numpy as np
+def test_matrix_accessors_return_numpy_arrays():
+    rotation = mathrobors.SO3.from_axis_angle((0.0, 0.0, 1.0), math.pi / 2.0)
+    transform = mathrobors.SE3.from_parts(rotation, (0.25, -0.5, 0.75))
+    adjoint = mathrobors.CMTM.from_se3(transform)
+
+    for matrix, dim in ((rotation.matrix(), 3), (transform.matrix(), 4), (adjoint.matrix(), 6)):
+        assert isinstance(matrix, np.ndarray)
+        assert matrix.shape == (dim, dim)
+        assert matrix.dtype == np.float64
+        assert matrix.flags["C_CONTIGUOUS"]
 
+    approx_eq(transform.matrix()[:3, 3], (0.25, -0.5, 0.75), 1e-12)
+
+def test_matrices_are_exposed_through_the_buffer_protocol():
+    rotation = mathrobors.SO3.from_axis_angle((0.0, 0.0, 1.0), math.pi / 2.0)
+    transform = mathrobors.SE3.from_parts(rotation, (0.25, -0.5, 0.75))
+    adjoint = mathrobors.CMTM.from_se3(transform)
+
+    for obj in (rotation, transform, adjoint):
+        view = np.asarray(obj)
+        assert view.dtype == np.float64
+        assert not view.flags["WRITEABLE"]
+        assert np.shares_memory(view, np.asarray(obj))
+        assert np.array_equal(view, obj.matrix())
+        assert memoryview(obj).shape == obj.matrix().shape
+        assert obj.__array__(dtype=np.float32).dtype == np.float32
+
+def test_cached_representations_are_stable_copies():
+    rotation = mathrobors.SO3.from_axis_angle((0.0, 0.0, 1.0), math.pi / 2.0)
+    assert rotation.quaternion() == rotation.quaternion()
+
+    transform = mathrobors.SE3.from_parts(rotation, (0.25, -0.5, 0.75))
+    first = transform.matrix()
+    first[0, 3] = 100.0
+    approx_eq(transform.matrix()[:3, 3], (0.25, -0.5, 0.75), 1e-12)
+
+
+def test_axis_angle_quaternion_matches_matrix_conversion():
+    cases = (((0.3, -0.2, 0.9), 0.7), ((1.0, 2.0, 3.0), 5.0), ((1.0, 0.0, 0.0), 3e-5))
+    for axis, angle in cases:
+        rotation = mathrobors.SO3.from_axis_angle(axis, angle)
+        quat = rotation.quaternion()
+        assert quat[0] >= 0.0
+        approx_eq(quat, mathrobors.SO3.mat_to_quaternion(rotation.matrix()), 1e-12)
+
+
+def test_quaternion_apply_matches_matrix_apply():
+    rotation = mathrobors.SO3.from_axis_angle((0.3, -0.2, 0.9), 0.7)
+    point = (0.5, -0.25, 1.0)
+    rotated = mathrobors.SO3.quaternion_apply(rotation.quaternion(), point)
+    approx_eq(rotated, rotation.apply(point), 1e-12)
+
+    scaled = [2.0 * c for c in rotation.quaternion()]
+    approx_eq(mathrobors.SO3.quaternion_apply(scaled, point), rotation.apply(point), 1e-12)
+
+
+def test_vector_arguments_accept_any_numeric_sequence():
+    expected = mathrobors.SO3.from_axis_angle((0.0, 0.0, 1.0), math.pi / 2.0).matrix()
+
+    for axis in ((0, 0, 1), [0.0, 0.0, 1.0], np.array([0.0, 0.0, 1.0])):
+        rotation = mathrobors.SO3.from_axis_angle(axis, math.pi / 2.0)
+        approx_eq(rotation.matrix(), expected, 1e-12)
+
+    with pytest.raises(ValueError):
+        mathrobors.SO3.hat((0.0, 1.0))
+
+
+def test_matrix_arguments_accept_arrays_and_nested_sequences():
+    hat = mathrobors.SO3.hat((0.2, 0.3, 0.4))
+    for matrix in (hat, hat.tolist(), hat.T.copy().T, hat.astype(np.float32)):
+        approx_eq(mathrobors.SO3.vee(matrix), (0.2, 0.3, 0.4), 1e-6)
+
+    transform = mathrobors.SE3.from_axis_angle_translation(
+        (0.0, 0.0, 1.0), 0.5, (1.0, 2.0, 3.0)
+    )
+    for matrix in (transform.matrix(), transform.matrix().tolist()):
+        approx_eq(mathrobors.SE3.from_matrix(matrix).matrix(), transform.matrix(), 1e-12)
+
+    with pytest.raises(ValueError):
+        mathrobors.SO3.vee(np.zeros((2, 3)))
+
+
+def test_apply_many_matches_single_point_apply():
+    rotation = mathrobors.SO3.from_axis_angle((0.3, -0.2, 0.9), 0.7)
+    points = np.arange(21, dtype=float).reshape(7, 3) - 10.0
+
+    batches = (
+        points,
+        np.asfortranarray(points),
+        np.repeat(points, 2, axis=0)[::2],
+        points.astype(np.int64),
+        points.tolist(),
+    )
+    for batch in batches:
+        rotated = rotation.apply_many(batch)
+        assert rotated.shape == (7, 3)
+        for point, rotated_point in zip(points, rotated):
+            approx_eq(rotated_point, rotation.apply(tuple(point)), 1e-12)
+
+    with pytest.raises(ValueError):
+        rotation.apply_many(np.zeros((4, 2)))
+    with pytest.raises(ValueError):
+        rotation.apply_many([1.0, 2.0, 3.0])
+
+
+@pytest.mark.dev
+def test_compare_mathrobo(mr):
     rotation = mathrobors.SO3.from_axis_angle((0.0, 0.0, 1.0), math.pi / 2.0)
     rotation_mr = mr.SO3.set_mat(mr.SO3.exp((0.0, 0.0, 1.0), math.pi / 2.0))
 
-    assert rotation.matrix() == rotation_mr.mat().tolist()
+    assert np.array_equal(rotation, rotation_mr.mat())
     assert rotation.quaternion() == rotation_mr.quaternion().tolist()
 
     eye = mathrobors.SO3.eye()
     eye_mr = mr.SO3.eye()
-    assert eye.mat() == eye_mr.mat().tolist()
+    assert np.array_equal(eye, eye_mr.mat())
 
     hat = mathrobors.SO3.hat((0.2, 0.3, 0.4))
     hat_mr = mr.SO3.hat(np.array([0.2, 0.3, 0.4]))
-    assert hat == hat_mr.tolist()
+    assert hat.tolist() == hat_mr.tolist()
 
     vee = mathrobors.SO3.vee(hat)
     vee_mr = mr.SO3.vee(hat_mr)
@@ -140,87 +220,102 @@ def test_compare_mathrobo():
 
     commute = mathrobors.SO3.hat_commute((0.2, 0.3, 0.4))
     commute_mr = mr.SO3.hat_commute(np.array([0.2, 0.3, 0.4]))
-    assert commute == commute_mr.tolist()
+    assert commute.tolist() == commute_mr.tolist()
 
     exp = mathrobors.SO3.exp((0.1, -0.2, 0.3), None)
     exp_mr = mr.SO3.exp(np.array([0.1, -0.2, 0.3]))
-    assert exp == exp_mr.tolist()
+    assert exp.tolist() == exp_mr.tolist()
+
+BENCHMARK_IMPLS = ["mathrobors", "mathrobo", "mathrobo_fast"]
+BENCHMARK_ROUNDS = 200
+BENCHMARK_ITERATIONS = 500
+BENCHMARK_WARMUP_ROUNDS = 5
+
+EXP_VECTOR = (0.1, -0.2, 0.3)
+EXP_VECTOR_NP = np.array(EXP_VECTOR)
+HAT_VECTOR = (0.2, 0.3, 0.4)
+HAT_VECTOR_NP = np.array(HAT_VECTOR)
+
+
+def run_benchmark(benchmark, fn, *args):
+    """Time ``fn(*args)`` directly, without a wrapping lambda, over fixed
+    rounds after a warmup so runs are comparable."""
+    benchmark.pedantic(
+        fn,
+        args=args,
+        rounds=BENCHMARK_ROUNDS,
+        iterations=BENCHMARK_ITERATIONS,
+        warmup_rounds=BENCHMARK_WARMUP_ROUNDS,
+    )
 
-@pytest.mark.dev
-@pytest.mark.parametrize("impl", ["mathrobors", "mathrobo"])
-def test_so3_exp_benchmark(benchmark, impl):
-    import numpy as np
-    import mathrobo as mr
 
-    v = (0.1, -0.2, 0.3)
-    v_np = np.array(v)
+def jit_reference(fn, *args):
+    """Compile a ``mathrobo_fast`` kernel before timing it."""
+    fn(*args)
+    return fn
+
 
+@pytest.mark.dev
+@pytest.mark.parametrize("impl", BENCHMARK_IMPLS)
+def test_so3_exp_benchmark(benchmark, impl, request):
     if impl == "mathrobors":
-        fn = lambda: mathrobors.SO3.exp(v, None)
+        run_benchmark(benchmark, mathrobors.SO3.exp, EXP_VECTOR, None)
+    elif impl == "mathrobo":
+        mr = request.getfixturevalue("mr")
+        run_benchmark(benchmark, mr.SO3.exp, EXP_VECTOR_NP)
     else:
-        fn = lambda: mr.SO3.exp(v_np)
-
-    benchmark(fn)
+        fast = pytest.importorskip("mathrobo_fast")
+        run_benchmark(benchmark, jit_reference(fast.so3_exp, EXP_VECTOR_NP), EXP_VECTOR_NP)
 
 @pytest.mark.dev
-@pytest.mark.parametrize("impl", ["mathrobors", "mathrobo"])
-def test_so3_hat_benchmark(benchmark, impl):
-    import numpy as np
-    import mathrobo as mr
-
-    w = (0.2, 0.3, 0.4)
-    w_np = np.array(w)
-
+@pytest.mark.parametrize("impl", BENCHMARK_IMPLS)
+def test_so3_hat_benchmark(benchmark, impl, request):
     if impl == "mathrobors":
-        fn = lambda: mathrobors.SO3.hat(w)
+        run_benchmark(benchmark, mathrobors.SO3.hat, HAT_VECTOR)
+    elif impl == "mathrobo":
+        mr = request.getfixturevalue("mr")
+        run_benchmark(benchmark, mr.SO3.hat, HAT_VECTOR_NP)
     else:
-        fn = lambda: mr.SO3.hat(w_np)
-
-    benchmark(fn)
+        fast = pytest.importorskip("mathrobo_fast")
+        run_benchmark(benchmark, jit_reference(fast.hat, HAT_VECTOR_NP), HAT_VECTOR_NP)
 
 @pytest.mark.dev
-@pytest.mark.parametrize("impl", ["mathrobors", "mathrobo"])
-def test_so3_vee_benchmark(benchmark, impl):
-    import numpy as np
-    import mathrobo as mr
-
-    w = (0.2, 0.3, 0.4)
-    w_np = np.array(w)
-
+@pytest.mark.parametrize("impl", BENCHMARK_IMPLS)
+def test_so3_vee_benchmark(benchmark, impl, request):
     if impl == "mathrobors":
-        hat = mathrobors.SO3.hat(w)
-        fn = lambda: mathrobors.SO3.vee(hat)
+        hat = mathrobors.SO3.hat(HAT_VECTOR)
+        run_benchmark(benchmark, mathrobors.SO3.vee, hat)
+    elif impl == "mathrobo":
+        mr = request.getfixturevalue("mr")
+        hat = mr.SO3.hat(HAT_VECTOR_NP)
+        run_benchmark(benchmark, mr.SO3.vee, hat)
     else:
-        hat = mr.SO3.hat(w_np)
-        fn = lambda: mr.SO3.vee(hat)
-
-    benchmark(fn)
+        fast = pytest.importorskip("mathrobo_fast")
+        hat = fast.hat(HAT_VECTOR_NP)
+        run_benchmark(benchmark, jit_reference(fast.vee, hat), hat)
 
 @pytest.mark.dev
-@pytest.mark.parametrize("impl", ["mathrobors", "mathrobo"])
-def test_so3_hat_commute_benchmark(benchmark, impl):
-    import numpy as np
-    import mathrobo as mr
-
-    w = (0.2, 0.3, 0.4)
-    w_np = np.array(w)
-
+@pytest.mark.parametrize("impl", BENCHMARK_IMPLS)
+def test_so3_hat_commute_benchmark(benchmark, impl, request):
     if impl == "mathrobors":
-        fn = lambda: mathrobors.SO3.hat_commute(w)
+        run_benchmark(benchmark, mathrobors.SO3.hat_commute, HAT_VECTOR)
+    elif impl == "mathrobo":
+        mr = request.getfixturevalue("mr")
+        run_benchmark(benchmark, mr.SO3.hat_commute, HAT_VECTOR_NP)
     else:
-        fn = lambda: mr.SO3.hat_commute(w_np)
-
-    benchmark(fn)
+        fast = pytest.importorskip("mathrobo_fast")
+        run_benchmark(
+            benchmark, jit_reference(fast.hat_commute, HAT_VECTOR_NP), HAT_VECTOR_NP
+        )
 
 @pytest.mark.dev
-@pytest.mark.parametrize("impl", ["mathrobors", "mathrobo"])
-def test_so3_eye_benchmark(benchmark, impl):
-    import mathrobo as mr
-
+@pytest.mark.parametrize("impl", BENCHMARK_IMPLS)
+def test_so3_eye_benchmark(benchmark, impl, request):
     if impl == "mathrobors":
-        fn = lambda: mathrobors.SO3.eye()
+        run_benchmark(benchmark, mathrobors.SO3.eye)
+    elif impl == "mathrobo":
+        mr = request.getfixturevalue("mr")
+        run_benchmark(benchmark, mr.SO3.eye)
     else:
-        fn = lambda: mr.SO3.eye()
-
-    benchmark(fn)
-
+        fast = pytest.importorskip("mathrobo_fast")
+        run_benchmark(benchmark, jit_reference(fast.eye))
@@ -1,7 +1,8 @@
 use nalgebra::{DMatrix, SMatrix, SVector};
 use std::ops::Mul;
 
-use crate::lie::{apply_linear, matrix_to_array, HasAdjoint};
+use crate::dispatch::kernels;
+use crate::lie::{apply_linear, matrix_to_array, HasAdjoint, LieGroup};
 use crate::se3::Se3;
 use crate::so3::So3;
 use crate::util::{skew_symmetric, vector3_from_array};
@@ -9,6 +10,53 @@ use crate::util::{skew_symmetric, vector3_from_array};
 pub type Matrix6 = SMatrix<f64, 6, 6>;
 pub type Vector6 = SVector<f64, 6>;
 
+/// Row-major 6×6 product \(AB\), used for spatial CMTM composition.
+#[inline]
+pub fn matmul6_raw(a: &[f64; 36], b: &[f64; 36]) -> [f64; 36] {
+    (kernels().matmul6)(a, b)
+}
+
+#[inline]
+pub(crate) fn matmul6_scalar(a: &[f64; 36], b: &[f64; 36]) -> [f64; 36] {
+    let mut out = [0.0; 36];
+    for i in 0..6 {
+        let row = &a[6 * i..6 * i + 6];
+        for j in 0..6 {
+            let mut acc = row[0] * b[j];
+            for k in 1..6 {
+                acc = row[k].mul_add(b[6 * k + j], acc);
+            }
+            out[6 * i + j] = acc;
+        }
+    }
+    out
+}
+
+/// Each output row is split into a 4-wide strip (columns 0..4, one ymm) and a
+/// 2-wide strip (columns 4..6, one xmm). Every \(a_{ik}\) is broadcast once and
+/// FMA'd against both strips of row `k` of `b`.
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2,fma")]
+pub(crate) unsafe fn matmul6_avx2(a: &[f64; 36], b: &[f64; 36], out: &mut [f64; 36]) {
+    use std::arch::x86_64::*;
+
+    unsafe {
+        for i in 0..6 {
+            let row = a.as_ptr().add(6 * i);
+            let mut lo = _mm256_mul_pd(_mm256_broadcast_sd(&*row), _mm256_loadu_pd(b.as_ptr()));
+            let mut hi = _mm_mul_pd(_mm_set1_pd(*row), _mm_loadu_pd(b.as_ptr().add(4)));
+            for k in 1..6 {
+                let b_row = b.as_ptr().add(6 * k);
+                let a_ik = *row.add(k);
+                lo = _mm256_fmadd_pd(_mm256_set1_pd(a_ik), _mm256_loadu_pd(b_row), lo);
+                hi = _mm_fmadd_pd(_mm_set1_pd(a_ik), _mm_loadu_pd(b_row.add(4)), hi);
+            }
+            _mm256_storeu_pd(out.as_mut_ptr().add(6 * i), lo);
+            _mm_storeu_pd(out.as_mut_ptr().add(6 * i + 4), hi);
+        }
+    }
+}
+
 /// Composite Motion Transformation Matrix (CMTM) used to move spatial
 /// velocities between coordinate frames.
 #[derive(Debug, Clone, PartialEq)]
@@ -84,7 +132,7 @@ impl GenericCmtm<3> {
     /// rotation. This is the 3×3 adjoint representation that maps angular
     /// velocities between frames.
     pub fn from_so3(rotation: &So3) -> Self {
-        let matrix = rotation.rotation().matrix().clone_owned();
+        let matrix = rotation.as_matrix();
         Self {
             matrix,
             derivatives: Vec::new(),
@@ -93,7 +141,7 @@ impl GenericCmtm<3> {
 
     /// Create an SO(3) CMTM that tracks derivatives up to order `n`.
     pub fn from_so3_with_derivatives(rotation: &So3, derivatives: Vec<[f64; 3]>) -> Self {
-        let matrix = rotation.rotation().matrix().clone_owned();
+        let matrix = rotation.as_matrix();
         Self::with_derivatives(matrix, derivatives)
     }
 
@@ -176,7 +224,7 @@ impl<const DIM: usize> GenericCmtm<DIM> {
     /// derivative vectors order-wise. Missing derivative orders on either side
     /// are treated as zero, so the resulting order matches the larger operand.
     pub fn compose(&self, other: &Self) -> Self {
-        let matrix = self.matrix * other.matrix;
+        let matrix = Self::matmul(&self.matrix, &other.matrix);
         let max_order = usize::max(self.derivatives.len(), other.derivatives.len());
 
         let derivatives = (0..max_order)
@@ -198,6 +246,20 @@ impl<const DIM: usize> GenericCmtm<DIM> {
         Self { matrix, derivatives }
     }
 
+    /// Matrix product routed through [`matmul6_raw`] for the spatial 6×6 case.
+    /// nalgebra buffers are column-major (the row-major buffer of the
+    /// transpose), so \((AB)^T = B^T A^T\) lets the kernel run on them directly.
+    fn matmul(a: &SMatrix<f64, DIM, DIM>, b: &SMatrix<f64, DIM, DIM>) -> SMatrix<f64, DIM, DIM> {
+        if DIM == 6 {
+            let product = matmul6_raw(
+                b.as_slice().try_into().unwrap(),
+                a.as_slice().try_into().unwrap(),
+            );
+            return SMatrix::<f64, DIM, DIM>::from_column_slice(&product);
+        }
+        a * b
+    }
+
     fn mat_elem(&self, p: usize) -> SMatrix<f64, DIM, DIM> {
         if p == 0 {
             return self.matrix;
@@ -208,7 +270,7 @@ impl<const DIM: usize> GenericCmtm<DIM> {
             let prev = self.mat_elem(p - i - 1);
             let scaled = self.derivatives[i] / Self::factorial(i);
             let hat = self.hat_adj(&scaled);
-            mat += prev * hat;
+            mat += Self::matmul(&prev, &hat);
         }
 
         mat / p as f64
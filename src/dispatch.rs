@@ -0,0 +1,133 @@
+//! Runtime selection of the flat kernels.
+//!
+//! [`so3::exp_raw`], [`so3::euler_zyx_raw`], [`so3::apply_many_raw`],
+//! [`se3::compose_raw`] and [`cmtm::matmul6_raw`] are selected here. The SIMD
+//! kernels are compiled with `#[target_feature]`, so the crate builds for
+//! baseline x86-64 and still uses AVX2/FMA on CPUs that have it. Every SIMD
+//! kernel has a scalar `mul_add` fallback with the same rounding, so results
+//! do not depend on the CPU. On a baseline build `f64::mul_add` is an
+//! out-of-line libm call, so the scalar kernels also get an FMA-enabled build
+//! in which it lowers to a single instruction. The CPU is probed once, the
+//! first time any kernel is needed (or eagerly through [`init`]), and every
+//! later call goes through a single indirect call into the chosen
+//! implementation.
+
+use std::sync::OnceLock;
+
+use crate::{cmtm, se3, so3};
+
+/// Function pointers for every dispatched kernel.
+#[doc(hidden)]
+#[derive(Debug, Clone, Copy)]
+pub struct Kernels {
+    pub so3_exp: fn([f64; 3]) -> [f64; 9],
+    pub so3_apply_many: fn(&[f64; 9], &[f64], &mut [f64]),
+    pub euler_zyx: fn(f64, f64, f64) -> [f64; 9],
+    pub se3_compose: fn(&[f64; 9], &[f64; 3], &[f64; 9], &[f64; 3]) -> ([f64; 9], [f64; 3]),
+    pub matmul6: fn(&[f64; 36], &[f64; 36]) -> [f64; 36],
+}
+
+static KERNELS: OnceLock<Kernels> = OnceLock::new();
+
+/// Probe the CPU and install the kernel table. Calling this is optional; it
+/// lets extension modules pay for detection at import time rather than on the
+/// first call.
+pub fn init() {
+    kernels();
+}
+
+/// The kernel table for this CPU.
+#[doc(hidden)]
+#[inline]
+pub fn kernels() -> &'static Kernels {
+    KERNELS.get_or_init(detect)
+}
+
+/// The portable kernels, available on every target. The selected kernels
+/// produce bit-identical results.
+#[doc(hidden)]
+pub fn scalar_kernels() -> Kernels {
+    Kernels {
+        so3_exp: so3::exp_scalar,
+        so3_apply_many: so3::apply_many_scalar,
+        euler_zyx: so3::euler_zyx_scalar,
+        se3_compose: se3::compose_scalar,
+        matmul6: cmtm::matmul6_scalar,
+    }
+}
+
+fn detect() -> Kernels {
+    #[allow(unused_mut)]
+    let mut table = scalar_kernels();
+    #[cfg(target_arch = "x86_64")]
+    {
+        if is_x86_feature_detected!("fma") {
+            table.so3_exp = x86::so3_exp_fma;
+            table.so3_apply_many = x86::so3_apply_many_fma;
+            table.euler_zyx = x86::euler_zyx_fma;
+        }
+        if is_x86_feature_detected!("avx2") && is_x86_feature_detected!("fma") {
+            table.so3_apply_many = x86::so3_apply_many_avx2;
+            table.se3_compose = x86::se3_compose_avx2;
+            table.matmul6 = x86::matmul6_avx2;
+        }
+    }
+    table
+}
+
+/// Safe entry points for the `#[target_feature]` kernels. They are only
+/// installed by [`detect`] after the features they need have been confirmed.
+#[cfg(target_arch = "x86_64")]
+mod x86 {
+    use crate::{cmtm, se3, so3};
+
+    /// Define a safe wrapper around an FMA-enabled build of an
+    /// `#[inline(always)]` scalar kernel.
+    macro_rules! fma_build {
+        ($(fn $name:ident($($arg:ident: $ty:ty),*) $(-> $ret:ty)? = $scalar:path;)*) => {$(
+            pub(super) fn $name($($arg: $ty),*) $(-> $ret)? {
+                #[target_feature(enable = "fma")]
+                unsafe fn build($($arg: $ty),*) $(-> $ret)? {
+                    $scalar($($arg),*)
+                }
+                unsafe { build($($arg),*) }
+            }
+        )*};
+    }
+
+    fma_build! {
+        fn so3_exp_fma(v: [f64; 3]) -> [f64; 9] = so3::exp_scalar;
+        fn so3_apply_many_fma(m: &[f64; 9], points: &[f64], out: &mut [f64]) =
+            so3::apply_many_scalar;
+        fn euler_zyx_fma(roll: f64, pitch: f64, yaw: f64) -> [f64; 9] = so3::euler_zyx_scalar;
+    }
+
+    pub(super) fn so3_apply_many_avx2(m: &[f64; 9], points: &[f64], out: &mut [f64]) {
+        // The scalar tail is inlined here so it is also compiled with FMA.
+        #[target_feature(enable = "avx2,fma")]
+        unsafe fn build(m: &[f64; 9], points: &[f64], out: &mut [f64]) {
+            let done = points.len() / 12 * 12;
+            unsafe { so3::apply_many_avx2(m, &points[..done], &mut out[..done]) };
+            so3::apply_many_scalar(m, &points[done..], &mut out[done..]);
+        }
+        unsafe { build(m, points, out) }
+    }
+
+    pub(super) fn se3_compose_avx2(
+        ar: &[f64; 9],
+        at: &[f64; 3],
+        br: &[f64; 9],
+        bt: &[f64; 3],
+    ) -> ([f64; 9], [f64; 3]) {
+        let mut rotation = [0.0; 9];
+        let mut translation = [0.0; 3];
+        unsafe { se3::compose_avx2(ar, at, br, bt, &mut rotation, &mut translation) };
+        (rotation, translation)
+    }
+
+    pub(super) fn matmul6_avx2(a: &[f64; 36], b: &[f64; 36]) -> [f64; 36] {
+        let mut out = [0.0; 36];
+        unsafe { cmtm::matmul6_avx2(a, b, &mut out) };
+        out
+    }
+}
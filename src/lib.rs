@@ -1,4 +1,5 @@
 pub mod cmtm;
+pub mod dispatch;
 pub mod lie;
 pub mod se3;
 pub mod so3;
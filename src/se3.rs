@@ -1,18 +1,85 @@
-use nalgebra::{Matrix3, Matrix4, Rotation3, SMatrix, Translation3, Vector3};
+use nalgebra::{Matrix3, Matrix4, Rotation3, SMatrix, Vector3};
 use std::ops::Mul;
 
 use crate::{
+    dispatch::kernels,
     lie::{HasAdjoint, LieGroup, matrix_to_array},
     so3::So3,
-    util::{vector3_from_array, vector3_to_array},
+    util::vector3_from_array,
 };
 
+/// Fused SE(3) composition on row-major buffers: returns
+/// \((R_a R_b,\; R_a t_b + t_a)\).
+#[inline]
+pub fn compose_raw(
+    ar: &[f64; 9],
+    at: &[f64; 3],
+    br: &[f64; 9],
+    bt: &[f64; 3],
+) -> ([f64; 9], [f64; 3]) {
+    (kernels().se3_compose)(ar, at, br, bt)
+}
+
+#[inline]
+pub(crate) fn compose_scalar(
+    ar: &[f64; 9],
+    at: &[f64; 3],
+    br: &[f64; 9],
+    bt: &[f64; 3],
+) -> ([f64; 9], [f64; 3]) {
+    let mut rotation = [0.0; 9];
+    let mut translation = [0.0; 3];
+    for i in 0..3 {
+        let row = &ar[3 * i..3 * i + 3];
+        for j in 0..3 {
+            rotation[3 * i + j] =
+                row[2].mul_add(br[6 + j], row[1].mul_add(br[3 + j], row[0] * br[j]));
+        }
+        translation[i] = row[2].mul_add(bt[2], row[1].mul_add(bt[1], row[0].mul_add(bt[0], at[i])));
+    }
+    (rotation, translation)
+}
+
+/// Treats \([R_b \mid t_b]\) as three 4-lane rows, so the broadcast row of
+/// \(R_a\) produces an output rotation row and the matching translation entry
+/// in one pass over \(R_b\). The fourth lane of each accumulator is seeded with
+/// \(t_a\).
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2,fma")]
+pub(crate) unsafe fn compose_avx2(
+    ar: &[f64; 9],
+    at: &[f64; 3],
+    br: &[f64; 9],
+    bt: &[f64; 3],
+    rotation: &mut [f64; 9],
+    translation: &mut [f64; 3],
+) {
+    use std::arch::x86_64::*;
+
+    unsafe {
+        let b0 = _mm256_setr_pd(br[0], br[1], br[2], bt[0]);
+        let b1 = _mm256_setr_pd(br[3], br[4], br[5], bt[1]);
+        let b2 = _mm256_setr_pd(br[6], br[7], br[8], bt[2]);
+        let mut row_out = [0.0; 4];
+        for i in 0..3 {
+            let row = ar.as_ptr().add(3 * i);
+            let seed = _mm256_setr_pd(0.0, 0.0, 0.0, at[i]);
+            let mut acc = _mm256_fmadd_pd(_mm256_set1_pd(*row), b0, seed);
+            acc = _mm256_fmadd_pd(_mm256_set1_pd(*row.add(1)), b1, acc);
+            acc = _mm256_fmadd_pd(_mm256_set1_pd(*row.add(2)), b2, acc);
+            _mm256_storeu_pd(row_out.as_mut_ptr(), acc);
+            rotation[3 * i..3 * i + 3].copy_from_slice(&row_out[..3]);
+            translation[i] = row_out[3];
+        }
+    }
+}
+
 /// A rigid-body transform in the special Euclidean group \(\mathrm{SE}(3)\),
-/// storing a rotation and translation.
+/// storing a row-major rotation and a translation as flat arrays.
 #[derive(Debug, Clone, PartialEq)]
 pub struct Se3 {
     rotation: So3,
-    translation: Translation3<f64>,
+    translation: [f64; 3],
 }
 
 impl Se3 {
@@ -20,35 +87,11 @@ impl Se3 {
     /// The bottom row is assumed to be `[0, 0, 0, 1]` and the top-left
     /// 3×3 block is interpreted as a rotation matrix.
     pub fn from_matrix(matrix: [[f64; 4]; 4]) -> Self {
-        let flat: [f64; 16] = [
-            matrix[0][0],
-            matrix[0][1],
-            matrix[0][2],
-            matrix[0][3],
-            matrix[1][0],
-            matrix[1][1],
-            matrix[1][2],
-            matrix[1][3],
-            matrix[2][0],
-            matrix[2][1],
-            matrix[2][2],
-            matrix[2][3],
-            matrix[3][0],
-            matrix[3][1],
-            matrix[3][2],
-            matrix[3][3],
-        ];
-        let mat = Matrix4::from_row_slice(&flat);
-
-        let rotation_matrix: [[f64; 3]; 3] = [
-            [mat[(0, 0)], mat[(0, 1)], mat[(0, 2)]],
-            [mat[(1, 0)], mat[(1, 1)], mat[(1, 2)]],
-            [mat[(2, 0)], mat[(2, 1)], mat[(2, 2)]],
-        ];
-
-        let translation = [mat[(0, 3)], mat[(1, 3)], mat[(2, 3)]];
-
-        Self::from_parts(So3::from_matrix(rotation_matrix), translation)
+        let [r0, r1, r2, _] = matrix;
+        let rotation = So3::from_row_major([
+            r0[0], r0[1], r0[2], r1[0], r1[1], r1[2], r2[0], r2[1], r2[2],
+        ]);
+        Self::from_parts(rotation, [r0[3], r1[3], r2[3]])
     }
 
     /// Construct the Lie-algebra hat operator mapping a 6D twist vector
@@ -135,7 +178,7 @@ impl Se3 {
     pub fn from_parts(rotation: So3, translation: [f64; 3]) -> Self {
         Self {
             rotation,
-            translation: Translation3::new(translation[0], translation[1], translation[2]),
+            translation,
         }
     }
 
@@ -149,44 +192,42 @@ impl Se3 {
     /// Left-multiply two transforms so that the result maps a point by `other`
     /// and then by `self`.
     pub fn compose(&self, other: &Self) -> Self {
-        let new_rotation = self.rotation.compose(&other.rotation);
-        let translated =
-            self.translation.vector + self.rotation.rotation() * other.translation.vector;
-        Self {
-            rotation: new_rotation,
-            translation: Translation3::from(translated),
-        }
+        let (rotation, translation) = compose_raw(
+            self.rotation.row_major(),
+            &self.translation,
+            other.rotation.row_major(),
+            &other.translation,
+        );
+        Self::from_parts(So3::from_row_major(rotation), translation)
     }
 
     /// Compute the inverse rigid motion: \(T^{-1} = [R^T, -R^T t]\).
     pub fn inverse(&self) -> Self {
         let inv_rotation = self.rotation.inverse();
-        let inv_translation = -(inv_rotation.rotation() * self.translation.vector);
+        let [x, y, z] = inv_rotation.apply(self.translation);
         Self {
             rotation: inv_rotation,
-            translation: Translation3::from(inv_translation),
+            translation: [-x, -y, -z],
         }
     }
 
     /// Apply the rigid transform to a 3D point (rotate, then translate).
     pub fn apply(&self, point: [f64; 3]) -> [f64; 3] {
-        let point_vec = vector3_from_array(point);
-        let rotated = self.rotation.rotation() * point_vec;
-        let translated = rotated + self.translation.vector;
-        vector3_to_array(&translated)
+        let [x, y, z] = self.rotation.apply(point);
+        let t = &self.translation;
+        [x + t[0], y + t[1], z + t[2]]
     }
 
     /// Export the 4×4 homogeneous transform matrix.
     pub fn to_matrix(&self) -> [[f64; 4]; 4] {
-        let mut matrix = Matrix4::<f64>::identity();
-        let rotation_matrix = self.rotation.rotation().matrix();
-        for row in 0..3 {
-            for col in 0..3 {
-                matrix[(row, col)] = rotation_matrix[(row, col)];
-            }
-            matrix[(row, 3)] = self.translation.vector[row];
-        }
-        matrix_to_array(&matrix)
+        let r = self.rotation.row_major();
+        let t = &self.translation;
+        [
+            [r[0], r[1], r[2], t[0]],
+            [r[3], r[4], r[5], t[1]],
+            [r[6], r[7], r[8], t[2]],
+            [0.0, 0.0, 0.0, 1.0],
+        ]
     }
 
     pub fn rotation(&self) -> &So3 {
@@ -195,15 +236,14 @@ impl Se3 {
 
     /// Return the translation vector in \(\mathbb{R}^3\).
     pub fn translation(&self) -> [f64; 3] {
-        vector3_to_array(&self.translation.vector)
+        self.translation
     }
 
     /// Compute the adjoint representation \(\mathrm{Ad}_T\) that maps twists
     /// from the child frame into the parent frame.
     pub fn adjoint(&self) -> SMatrix<f64, 6, 6> {
-        let rotation = self.rotation.rotation();
-        let translation = self.translation();
-        let translation_vec = vector3_from_array(translation);
+        let rotation = self.rotation.as_matrix();
+        let translation_vec = vector3_from_array(self.translation);
         let skew = crate::util::skew_symmetric(&translation_vec);
 
         // The SE(3) adjoint has the block structure
@@ -214,9 +254,9 @@ impl Se3 {
         let mut matrix = SMatrix::<f64, 6, 6>::zeros();
         for r in 0..3 {
             for c in 0..3 {
-                matrix[(r, c)] = rotation.matrix()[(r, c)];
-                matrix[(r + 3, c + 3)] = rotation.matrix()[(r, c)];
-                matrix[(r + 3, c)] = (skew * rotation.matrix())[(r, c)];
+                matrix[(r, c)] = rotation[(r, c)];
+                matrix[(r + 3, c + 3)] = rotation[(r, c)];
+                matrix[(r + 3, c)] = (skew * rotation)[(r, c)];
             }
         }
 
@@ -228,7 +268,7 @@ impl LieGroup<4> for Se3 {
     fn identity() -> Self {
         Self {
             rotation: So3::identity(),
-            translation: Translation3::identity(),
+            translation: [0.0; 3],
         }
     }
 
@@ -241,15 +281,7 @@ impl LieGroup<4> for Se3 {
     }
 
     fn as_matrix(&self) -> SMatrix<f64, 4, 4> {
-        let mut matrix = Matrix4::<f64>::identity();
-        let rotation_matrix = self.rotation.rotation().matrix();
-        for row in 0..3 {
-            for col in 0..3 {
-                matrix[(row, col)] = rotation_matrix[(row, col)];
-            }
-            matrix[(row, 3)] = self.translation.vector[row];
-        }
-        matrix.clone_owned()
+        Matrix4::from_row_slice(self.to_matrix().as_flattened())
     }
 }
 
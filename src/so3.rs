@@ -1,162 +1,431 @@
-use nalgebra::{Matrix3, Quaternion, Rotation3, UnitQuaternion};
+use nalgebra::{Matrix3, Rotation3};
 use std::ops::Mul;
 
-use crate::lie::{LieGroup, apply_linear, matrix_to_array};
-use crate::util::{skew_symmetric, vector3_from_array, vector3_to_array};
+use crate::dispatch::kernels;
+use crate::lie::LieGroup;
+use crate::util::vector3_to_array;
+
+/// Row-major skew-symmetric matrix \([v]_\times\) of a 3D vector. Only six
+/// slots are written at fixed offsets, so there is no branching or loop.
+#[inline]
+pub fn hat_raw(v: [f64; 3]) -> [f64; 9] {
+    [0.0, -v[2], v[1], v[2], 0.0, -v[0], -v[1], v[0], 0.0]
+}
+
+/// Row-major \(-[v]_\times\), i.e. the hat matrix with every entry negated.
+#[inline]
+pub fn hat_commute_raw(v: [f64; 3]) -> [f64; 9] {
+    let mut m = hat_raw(v);
+    for x in &mut m {
+        *x = -*x;
+    }
+    m
+}
+
+/// Inverse of [`hat_raw`] on a row-major 3×3 matrix. The off-diagonal pairs
+/// are averaged so slightly non-skew inputs are symmetrized.
+#[inline]
+pub fn vee_raw(m: &[f64; 9]) -> [f64; 3] {
+    [
+        0.5 * (m[7] - m[5]),
+        0.5 * (m[2] - m[6]),
+        0.5 * (m[3] - m[1]),
+    ]
+}
+
+/// Row-major exponential map \(\exp([v]_\times)\) via Rodrigues' formula
+/// \(R = I + a K + b K^2\) with \(a = \sin\theta/\theta\) and
+/// \(b = (1-\cos\theta)/\theta^2\), expanded entry by entry into fused
+/// multiply-adds. Below \(\theta = 10^{-4}\) the coefficients switch to their
+/// Taylor series, which skips the square root and the division by a tiny
+/// angle.
+#[inline]
+pub fn exp_raw(v: [f64; 3]) -> [f64; 9] {
+    (kernels().so3_exp)(v)
+}
+
+#[inline(always)]
+pub(crate) fn exp_scalar(v: [f64; 3]) -> [f64; 9] {
+    let [x, y, z] = v;
+    let theta2 = x.mul_add(x, y.mul_add(y, z * z));
+    let (a, b) = if theta2 < 1e-8 {
+        (
+            theta2.mul_add(-1.0 / 6.0, 1.0),
+            theta2.mul_add(-1.0 / 24.0, 0.5),
+        )
+    } else {
+        let theta = theta2.sqrt();
+        let (s, c) = theta.sin_cos();
+        (s / theta, (1.0 - c) / theta2)
+    };
+
+    let (ax, ay, az) = (a * x, a * y, a * z);
+    let (bx, by) = (b * x, b * y);
+    [
+        (-b).mul_add(y.mul_add(y, z * z), 1.0),
+        bx.mul_add(y, -az),
+        bx.mul_add(z, ay),
+        bx.mul_add(y, az),
+        (-b).mul_add(x.mul_add(x, z * z), 1.0),
+        by.mul_add(z, -ax),
+        bx.mul_add(z, -ay),
+        by.mul_add(z, ax),
+        (-b).mul_add(x.mul_add(x, y * y), 1.0),
+    ]
+}
+
+/// Row-major rotation matrix of a unit quaternion \([w, x, y, z]\), written as
+/// \(R = I + 2w[q]_\times + 2[q]_\times^2\) so each entry is a pair of
+/// products on pre-doubled components. The input is not normalized.
+#[inline]
+pub fn quaternion_to_matrix_raw(q: [f64; 4]) -> [f64; 9] {
+    let [w, x, y, z] = q;
+    let (tx, ty, tz) = (2.0 * x, 2.0 * y, 2.0 * z);
+    let (wx, wy, wz) = (w * tx, w * ty, w * tz);
+    [
+        1.0 - y * ty - z * tz,
+        x * ty - wz,
+        x * tz + wy,
+        x * ty + wz,
+        1.0 - x * tx - z * tz,
+        y * tz - wx,
+        x * tz - wy,
+        y * tz + wx,
+        1.0 - x * tx - y * ty,
+    ]
+}
+
+/// Unit quaternion \([w, x, y, z]\) of a row-major rotation matrix using
+/// Shoemake's method without the usual branch ladder: all four candidate
+/// quaternions share the same diagonal sums and off-diagonal sums/differences,
+/// so they are built up front and the one with the largest
+/// \(4q_i^2\) is selected by index. Only the selected candidate needs a square
+/// root. The result is canonicalized to \(w \ge 0\).
+#[inline]
+pub fn matrix_to_quaternion_raw(m: &[f64; 9]) -> [f64; 4] {
+    let t = [
+        1.0 + m[0] + m[4] + m[8],
+        1.0 + m[0] - m[4] - m[8],
+        1.0 - m[0] + m[4] - m[8],
+        1.0 - m[0] - m[4] + m[8],
+    ];
+    let (d0, d1, d2) = (m[7] - m[5], m[2] - m[6], m[3] - m[1]);
+    let (s01, s02, s12) = (m[1] + m[3], m[2] + m[6], m[5] + m[7]);
+    let candidates = [
+        [t[0], d0, d1, d2],
+        [d0, t[1], s01, s02],
+        [d1, s01, t[2], s12],
+        [d2, s02, s12, t[3]],
+    ];
+    let mut index = 0;
+    for i in 1..4 {
+        index = if t[i] > t[index] { i } else { index };
+    }
+    let scale = (0.5 / t[index].sqrt()).copysign(candidates[index][0]);
+    candidates[index].map(|c| c * scale)
+}
+
+/// Scale a quaternion \([w, x, y, z]\) to unit length. The zero quaternion is
+/// returned unchanged.
+#[inline]
+pub fn normalize_quaternion_raw(q: [f64; 4]) -> [f64; 4] {
+    let [w, x, y, z] = q;
+    let norm = (w * w + x * x + y * y + z * z).sqrt();
+    if norm != 0.0 { q.map(|c| c / norm) } else { q }
+}
+
+/// Rotate a vector directly by a unit quaternion \([w, x, y, z]\) without
+/// building the matrix: \(v' = v + w t + q \times t\) with
+/// \(t = 2\, q \times v\). The quaternion is assumed to be normalized.
+#[inline]
+pub fn quaternion_apply_raw(q: [f64; 4], v: [f64; 3]) -> [f64; 3] {
+    let [w, x, y, z] = q;
+    let [vx, vy, vz] = v;
+    let tx = 2.0 * (y * vz - z * vy);
+    let ty = 2.0 * (z * vx - x * vz);
+    let tz = 2.0 * (x * vy - y * vx);
+    [
+        vx + w * tx + y * tz - z * ty,
+        vy + w * ty + z * tx - x * tz,
+        vz + w * tz + x * ty - y * tx,
+    ]
+}
+
+/// Row-major matrix–vector product \(R v\).
+#[inline]
+pub fn apply_raw(m: &[f64; 9], v: [f64; 3]) -> [f64; 3] {
+    let [x, y, z] = v;
+    [
+        m[0] * x + m[1] * y + m[2] * z,
+        m[3] * x + m[4] * y + m[5] * z,
+        m[6] * x + m[7] * y + m[8] * z,
+    ]
+}
+
+/// Rotate a batch of points stored as a flat row-major `N×3` buffer, writing
+/// \(R p_i\) into `out`.
+///
+/// # Panics
+///
+/// Panics if `points.len()` is not a multiple of 3 or `out` has a different
+/// length.
+pub fn apply_many_raw(m: &[f64; 9], points: &[f64], out: &mut [f64]) {
+    assert_eq!(points.len() % 3, 0, "points must be a flat N×3 buffer");
+    assert_eq!(points.len(), out.len(), "output length must match input");
+    (kernels().so3_apply_many)(m, points, out)
+}
+
+#[inline(always)]
+pub(crate) fn apply_many_scalar(m: &[f64; 9], points: &[f64], out: &mut [f64]) {
+    for (p, o) in points.chunks_exact(3).zip(out.chunks_exact_mut(3)) {
+        for (i, r) in m.chunks_exact(3).enumerate() {
+            o[i] = r[2].mul_add(p[2], r[1].mul_add(p[1], r[0] * p[0]));
+        }
+    }
+}
+
+/// Four points are transposed into x/y/z registers, so the nine entries of
+/// \(R\) stay broadcast in registers for the whole batch and each output
+/// coordinate is one multiply and two FMAs over four points. Trailing points
+/// that do not fill a group of four are left untouched.
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2,fma")]
+pub(crate) unsafe fn apply_many_avx2(m: &[f64; 9], points: &[f64], out: &mut [f64]) {
+    use std::arch::x86_64::*;
+
+    unsafe {
+        let r: [__m256d; 9] = std::array::from_fn(|k| _mm256_set1_pd(m[k]));
+        let mut lanes = [[0.0; 4]; 3];
+        for (p, o) in points.chunks_exact(12).zip(out.chunks_exact_mut(12)) {
+            let x = _mm256_setr_pd(p[0], p[3], p[6], p[9]);
+            let y = _mm256_setr_pd(p[1], p[4], p[7], p[10]);
+            let z = _mm256_setr_pd(p[2], p[5], p[8], p[11]);
+            for (i, lane) in lanes.iter_mut().enumerate() {
+                let mut acc = _mm256_mul_pd(r[3 * i], x);
+                acc = _mm256_fmadd_pd(r[3 * i + 1], y, acc);
+                acc = _mm256_fmadd_pd(r[3 * i + 2], z, acc);
+                _mm256_storeu_pd(lane.as_mut_ptr(), acc);
+            }
+            for j in 0..4 {
+                o[3 * j] = lanes[0][j];
+                o[3 * j + 1] = lanes[1][j];
+                o[3 * j + 2] = lanes[2][j];
+            }
+        }
+    }
+}
+
+/// Row-major \(R_z(\psi) R_y(\theta) R_x(\phi)\) for roll \(\phi\), pitch
+/// \(\theta\) and yaw \(\psi\), written in closed form so the three angles
+/// cost one `sin_cos` each and the products fold into fused multiply-adds.
+#[inline]
+pub fn euler_zyx_raw(roll: f64, pitch: f64, yaw: f64) -> [f64; 9] {
+    (kernels().euler_zyx)(roll, pitch, yaw)
+}
+
+#[inline(always)]
+pub(crate) fn euler_zyx_scalar(roll: f64, pitch: f64, yaw: f64) -> [f64; 9] {
+    let (sr, cr) = roll.sin_cos();
+    let (sp, cp) = pitch.sin_cos();
+    let (sy, cy) = yaw.sin_cos();
+    let (cy_sp, sy_sp) = (cy * sp, sy * sp);
+    [
+        cy * cp,
+        cy_sp.mul_add(sr, -(sy * cr)),
+        cy_sp.mul_add(cr, sy * sr),
+        sy * cp,
+        sy_sp.mul_add(sr, cy * cr),
+        sy_sp.mul_add(cr, -(cy * sr)),
+        -sp,
+        cp * sr,
+        cp * cr,
+    ]
+}
+
+/// Unit quaternion \([w, x, y, z]\) of a rotation by `angle` about `axis`,
+/// using the half angle directly. The axis is normalized first and a
+/// zero-length axis yields the identity. Below \(|\phi| = 10^{-4}\) the half-angle
+/// sine and cosine use their Taylor series. The result is canonicalized to
+/// \(w \ge 0\), matching [`matrix_to_quaternion_raw`].
+#[inline]
+pub fn axis_angle_to_quaternion_raw(axis: [f64; 3], angle: f64) -> [f64; 4] {
+    let [x, y, z] = axis;
+    let norm = (x * x + y * y + z * z).sqrt();
+    if norm == 0.0 {
+        return [1.0, 0.0, 0.0, 0.0];
+    }
+
+    let half = 0.5 * angle;
+    let (s, c) = if angle.abs() < 1e-4 {
+        let half2 = half * half;
+        (half - half2 * half / 6.0, 1.0 - 0.5 * half2)
+    } else {
+        half.sin_cos()
+    };
+    let sign = 1.0_f64.copysign(c);
+    let scale = sign * s / norm;
+    [sign * c, x * scale, y * scale, z * scale]
+}
+
+/// Row-major 3×3 product \(AB\).
+#[inline]
+pub fn compose_raw(a: &[f64; 9], b: &[f64; 9]) -> [f64; 9] {
+    let mut out = [0.0; 9];
+    for i in 0..3 {
+        let row = &a[3 * i..3 * i + 3];
+        for j in 0..3 {
+            out[3 * i + j] = row[0] * b[j] + row[1] * b[3 + j] + row[2] * b[6 + j];
+        }
+    }
+    out
+}
 
 /// A 3D rotation represented as an element of the special orthogonal group
-/// \(\mathrm{SO}(3)\).
+/// \(\mathrm{SO}(3)\), stored as a contiguous row-major 3×3 matrix so the flat
+/// kernels and the Python bindings can use the buffer directly.
 #[derive(Debug, Clone, PartialEq)]
 pub struct So3 {
-    rotation: Rotation3<f64>,
+    matrix: [f64; 9],
 }
 
 impl So3 {
-    /// Build an element of SO(3) from an axis and angle using Rodrigues'
-    /// rotation formula. Zero-length axes fall back to the identity
-    /// so the caller can safely pass unnormalized vectors.
+    /// Build an element of SO(3) from an axis and angle via the half-angle
+    /// quaternion. Zero-length axes fall back to the identity so the caller can
+    /// safely pass unnormalized vectors.
     pub fn from_axis_angle(axis: [f64; 3], angle: f64) -> Self {
-        let axis_vector = vector3_from_array(axis);
-        if axis_vector.norm() == 0.0 {
-            return Self::identity();
-        }
+        Self::from_axis_angle_with_quaternion(axis, angle).0
+    }
 
-        Self {
-            rotation: Rotation3::new(axis_vector.normalize() * angle),
-        }
+    /// Like [`So3::from_axis_angle`], but also return the half-angle
+    /// quaternion the rotation was built from. It equals
+    /// [`So3::to_quaternion`] of the result.
+    pub fn from_axis_angle_with_quaternion(axis: [f64; 3], angle: f64) -> (Self, [f64; 4]) {
+        let quaternion = axis_angle_to_quaternion_raw(axis, angle);
+        let rotation = Self {
+            matrix: quaternion_to_matrix_raw(quaternion),
+        };
+        (rotation, quaternion)
     }
 
     /// Compose two rotations using matrix multiplication: \(R_1 R_2\).
     pub fn compose(&self, other: &Self) -> Self {
         Self {
-            rotation: self.rotation * other.rotation,
+            matrix: compose_raw(&self.matrix, &other.matrix),
         }
     }
 
+    /// Construct a rotation from a row-major 3×3 buffer. Like
+    /// [`So3::from_matrix`], no orthonormality checks are performed.
+    pub fn from_row_major(matrix: [f64; 9]) -> Self {
+        Self { matrix }
+    }
+
+    /// Borrow the row-major 3×3 rotation matrix.
+    pub fn row_major(&self) -> &[f64; 9] {
+        &self.matrix
+    }
+
     /// Construct a rotation directly from a 3×3 matrix. The input is assumed to
     /// already be a valid rotation matrix; no orthonormality checks are
     /// performed.
     pub fn from_matrix(matrix: [[f64; 3]; 3]) -> Self {
-        let flat: [f64; 9] = [
-            matrix[0][0],
-            matrix[0][1],
-            matrix[0][2],
-            matrix[1][0],
-            matrix[1][1],
-            matrix[1][2],
-            matrix[2][0],
-            matrix[2][1],
-            matrix[2][2],
-        ];
-        let mat = Matrix3::from_row_slice(&flat);
         Self {
-            rotation: Rotation3::from_matrix_unchecked(mat),
+            matrix: matrix.as_flattened().try_into().unwrap(),
         }
     }
 
     /// Return the inverse rotation, i.e. the transpose of the rotation matrix.
     pub fn inverse(&self) -> Self {
+        let m = &self.matrix;
         Self {
-            rotation: self.rotation.inverse(),
+            matrix: [m[0], m[3], m[6], m[1], m[4], m[7], m[2], m[5], m[8]],
         }
     }
 
     /// Apply the rotation to a 3D vector.
     pub fn apply(&self, vector: [f64; 3]) -> [f64; 3] {
-        apply_linear(&self.rotation.matrix().clone_owned(), vector)
+        apply_raw(&self.matrix, vector)
+    }
+
+    /// Apply the rotation to every point of a flat row-major `N×3` buffer.
+    pub fn apply_many(&self, points: &[f64]) -> Vec<f64> {
+        let mut out = vec![0.0; points.len()];
+        apply_many_raw(&self.matrix, points, &mut out);
+        out
     }
 
     /// Construct an SO(3) element from a unit quaternion specified as
     /// \([w, x, y, z]\). The quaternion is normalized before use so callers do
     /// not need to pre-normalize inputs.
     pub fn from_quaternion(quaternion: [f64; 4]) -> Self {
-        let mut quat = Quaternion::new(quaternion[0], quaternion[1], quaternion[2], quaternion[3]);
-        if quat.norm() != 0.0 {
-            quat = quat.normalize();
-        }
         Self {
-            rotation: UnitQuaternion::from_quaternion(quat).to_rotation_matrix(),
+            matrix: quaternion_to_matrix_raw(normalize_quaternion_raw(quaternion)),
         }
     }
 
-    /// Export the rotation as a normalized quaternion \([w, x, y, z]\).
+    /// Export the rotation as a normalized quaternion \([w, x, y, z]\) with
+    /// \(w \ge 0\).
     pub fn to_quaternion(&self) -> [f64; 4] {
-        let unit = UnitQuaternion::from_rotation_matrix(&self.rotation);
-        let quat = unit.quaternion();
-        [quat.w, quat.i, quat.j, quat.k]
+        matrix_to_quaternion_raw(&self.matrix)
     }
 
     /// Build a rotation from roll–pitch–yaw angles applied in ZYX order.
     pub fn from_euler_angles(roll: f64, pitch: f64, yaw: f64) -> Self {
         Self {
-            rotation: Rotation3::from_euler_angles(roll, pitch, yaw),
+            matrix: euler_zyx_raw(roll, pitch, yaw),
         }
     }
 
     /// Return the roll–pitch–yaw angles (ZYX order) that generate this
     /// rotation.
     pub fn to_euler_angles(&self) -> (f64, f64, f64) {
-        self.rotation.euler_angles()
+        self.rotation().euler_angles()
     }
 
     /// Build a rotation directly from the so(3) tangent vector using the
     /// exponential map.
     pub fn from_rotation_vector(vector: [f64; 3]) -> Self {
-        let axis_angle = vector3_from_array(vector);
         Self {
-            rotation: Rotation3::new(axis_angle),
+            matrix: exp_raw(vector),
         }
     }
 
     /// Recover the tangent vector representation (logarithm map) using the
     /// Rodrigues rotation vector.
     pub fn to_rotation_vector(&self) -> [f64; 3] {
-        vector3_to_array(&self.rotation.scaled_axis())
+        vector3_to_array(&self.rotation().scaled_axis())
     }
 
     /// Create the skew-symmetric matrix associated with a 3D vector.
     pub fn hat(vector: [f64; 3]) -> [[f64; 3]; 3] {
-        matrix_to_array(&skew_symmetric(&vector3_from_array(vector)))
+        let m = hat_raw(vector);
+        [[m[0], m[1], m[2]], [m[3], m[4], m[5]], [m[6], m[7], m[8]]]
     }
 
     /// Recover the vector that generated a skew-symmetric matrix. The inputs do
     /// not need to be perfectly skew-symmetric; the off-diagonal elements are
     /// symmetrized.
     pub fn vee(matrix: [[f64; 3]; 3]) -> [f64; 3] {
-        let flat: [f64; 9] = [
-            matrix[0][0],
-            matrix[0][1],
-            matrix[0][2],
-            matrix[1][0],
-            matrix[1][1],
-            matrix[1][2],
-            matrix[2][0],
-            matrix[2][1],
-            matrix[2][2],
-        ];
-        let mat = Matrix3::from_row_slice(&flat);
-        [
-            0.5 * (mat[(2, 1)] - mat[(1, 2)]),
-            0.5 * (mat[(0, 2)] - mat[(2, 0)]),
-            0.5 * (mat[(1, 0)] - mat[(0, 1)]),
-        ]
+        vee_raw(matrix.as_flattened().try_into().unwrap())
     }
 
     /// Export the underlying 3×3 rotation matrix.
     pub fn to_matrix(&self) -> [[f64; 3]; 3] {
-        matrix_to_array(&self.rotation.matrix().clone_owned())
+        let m = &self.matrix;
+        [[m[0], m[1], m[2]], [m[3], m[4], m[5]], [m[6], m[7], m[8]]]
     }
 
-    /// Access the nalgebra `Rotation3` backing this object.
-    pub fn rotation(&self) -> &Rotation3<f64> {
-        &self.rotation
+    /// Convert into an nalgebra `Rotation3` for operations that are not
+    /// implemented on the flat storage.
+    pub fn rotation(&self) -> Rotation3<f64> {
+        Rotation3::from_matrix_unchecked(self.as_matrix())
     }
 }
 
 impl LieGroup<3> for So3 {
     fn identity() -> Self {
         Self {
-            rotation: Rotation3::identity(),
+            matrix: [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0],
         }
     }
 
@@ -169,7 +438,7 @@ impl LieGroup<3> for So3 {
     }
 
     fn as_matrix(&self) -> nalgebra::SMatrix<f64, 3, 3> {
-        self.rotation.matrix().clone_owned()
+        Matrix3::from_row_slice(&self.matrix)
     }
 }
 
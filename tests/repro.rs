@@ -1,9 +1,14 @@
 use std::f64::consts::FRAC_PI_2;
 
+use mathroborust::dispatch;
 use mathroborust::lie::LieGroup;
+use mathroborust::so3::{
+    axis_angle_to_quaternion_raw, compose_raw, exp_raw, hat_commute_raw, hat_raw,
+    normalize_quaternion_raw, quaternion_apply_raw, vee_raw,
+};
 use mathroborust::util::{skew_symmetric, vector3_from_array};
 use mathroborust::{RotationalCmtm, RustCmtm, RustSe3, RustSo3};
-use nalgebra::{DMatrix, SMatrix, SVector};
+use nalgebra::{DMatrix, Quaternion, Rotation3, SMatrix, SVector, UnitQuaternion};
 
 fn approx_eq(a: &[f64], b: &[f64], tol: f64) {
     assert_eq!(a.len(), b.len());
@@ -56,7 +61,7 @@ fn cmtm_adjoint_matches_reference() {
     let twist = [0.1, 0.2, 0.3, 1.0, 2.0, 3.0];
     let transformed = adjoint.apply_twist(twist);
 
-    let rotation_matrix = transform.rotation().rotation().matrix();
+    let rotation_matrix = transform.rotation().as_matrix();
     let translation = transform.translation();
     let translation_vec = vector3_from_array(translation);
     let skew = skew_symmetric(&translation_vec);
@@ -107,7 +112,7 @@ fn cmtm_block_matrix_handles_second_order() {
     // Expected 6×6 block matrix with the base rotation on both diagonal blocks
     // and the first derivative hat block in the lower-left corner.
     let mut expected = DMatrix::<f64>::zeros(6, 6);
-    let base = rotation.rotation().matrix();
+    let base = rotation.as_matrix();
     let hat = skew_symmetric(&vector3_from_array([0.1, -0.2, 0.3]));
     for r in 0..3 {
         for c in 0..3 {
@@ -136,7 +141,7 @@ fn cmtm_block_matrix_handles_third_order() {
     let block = adjoint.to_block_matrix(None);
 
     let mut expected = DMatrix::<f64>::zeros(9, 9);
-    let base = rotation.rotation().matrix();
+    let base = rotation.as_matrix();
     let hat0 = skew_symmetric(&vector3_from_array(w0));
     let hat1 = skew_symmetric(&vector3_from_array(w1));
     let mat2 = (hat1 + hat0 * hat0) / 2.0;
@@ -176,6 +181,79 @@ fn so3_quaternion_roundtrip_matches_matrix() {
     approx_eq_matrix(&original_matrix, &rebuilt_matrix, 1e-12);
 }
 
+#[test]
+fn so3_from_quaternion_matches_unit_quaternion() {
+    for q in [
+        [0.9, 0.1, -0.3, 0.2],
+        [-0.2, 1.5, 0.4, -0.7],
+        [1.0, 0.0, 0.0, 0.0],
+    ] {
+        let unit = UnitQuaternion::from_quaternion(Quaternion::new(q[0], q[1], q[2], q[3]));
+        let expected = unit.to_rotation_matrix();
+        let rotation = RustSo3::from_quaternion(q).as_matrix();
+        assert!((rotation - expected.matrix()).abs().max() < 1e-12);
+    }
+
+    assert_eq!(
+        RustSo3::from_quaternion([0.0; 4]).to_matrix(),
+        RustSo3::identity().to_matrix()
+    );
+}
+
+#[test]
+fn so3_to_quaternion_recovers_canonical_quaternion_for_every_pivot() {
+    // One quaternion per Shoemake pivot (w, x, y, z dominant), plus a
+    // half-turn that has w = 0.
+    for q in [
+        [0.9, 0.1, -0.3, 0.2],
+        [0.2, -0.9, 0.3, 0.1],
+        [0.1, 0.3, 0.9, -0.2],
+        [0.3, -0.2, 0.1, -0.9],
+        [0.0, 0.0, 1.0, 0.0],
+    ] {
+        let norm = q.iter().map(|c| c * c).sum::<f64>().sqrt();
+        let expected = q.map(|c| c / norm);
+        let recovered = RustSo3::from_quaternion(q).to_quaternion();
+        approx_eq(&recovered, &expected, 1e-12);
+        approx_eq(
+            &RustSo3::from_quaternion(q.map(|c| -c)).to_quaternion(),
+            &expected,
+            1e-12,
+        );
+    }
+}
+
+#[test]
+fn so3_from_euler_angles_matches_rotation3() {
+    for (roll, pitch, yaw) in [(0.1, -0.2, 0.3), (2.5, 1.2, -3.0), (0.0, FRAC_PI_2, 0.4)] {
+        let expected = Rotation3::from_euler_angles(roll, pitch, yaw);
+        let rotation = RustSo3::from_euler_angles(roll, pitch, yaw).as_matrix();
+        assert!((rotation - expected.matrix()).abs().max() < 1e-12);
+    }
+}
+
+#[test]
+fn so3_axis_angle_quaternion_is_canonical() {
+    for (axis, angle) in [
+        ([0.3, -0.2, 0.9], 0.7),
+        ([1.0, 2.0, 3.0], 5.0),
+        ([0.0, 0.0, 2.0], 3e-5),
+    ] {
+        let quaternion = axis_angle_to_quaternion_raw(axis, angle);
+        let rotation = RustSo3::from_axis_angle(axis, angle);
+        approx_eq(&quaternion, &rotation.to_quaternion(), 1e-12);
+
+        let (seeded, seed) = RustSo3::from_axis_angle_with_quaternion(axis, angle);
+        assert_eq!(seeded, rotation);
+        assert_eq!(seed, quaternion);
+    }
+
+    assert_eq!(
+        RustSo3::from_axis_angle([0.0; 3], 1.0).to_matrix(),
+        RustSo3::identity().to_matrix()
+    );
+}
+
 #[test]
 fn so3_rotation_vector_log_exp_roundtrip() {
     let vector = [0.2, -0.1, 0.3];
@@ -184,6 +262,28 @@ fn so3_rotation_vector_log_exp_roundtrip() {
     approx_eq(&recovered, &vector, 1e-12);
 }
 
+#[test]
+fn so3_exp_matches_axis_angle_including_small_angles() {
+    for vector in [[0.1, -0.2, 0.3], [1.5, 0.25, -2.0], [2e-5, -1e-5, 3e-5]] {
+        let norm = (vector[0] * vector[0] + vector[1] * vector[1] + vector[2] * vector[2]).sqrt();
+        let axis = [vector[0] / norm, vector[1] / norm, vector[2] / norm];
+        let expected = RustSo3::from_axis_angle(axis, norm).to_matrix();
+
+        let exp = exp_raw(vector);
+        let rows = [
+            [exp[0], exp[1], exp[2]],
+            [exp[3], exp[4], exp[5]],
+            [exp[6], exp[7], exp[8]],
+        ];
+        approx_eq_matrix(&rows, &expected, 1e-12);
+    }
+
+    assert_eq!(
+        exp_raw([0.0; 3]),
+        [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
+    );
+}
+
 #[test]
 fn hat_and_vee_are_inverses() {
     let vector = [0.25, -0.5, 1.25];
@@ -192,6 +292,24 @@ fn hat_and_vee_are_inverses() {
     approx_eq(&recovered, &vector, 1e-12);
 }
 
+#[test]
+fn flat_hat_kernels_match_skew_symmetric() {
+    let vector = [0.2, 0.3, 0.4];
+    let hat = hat_raw(vector);
+    let skew = skew_symmetric(&vector3_from_array(vector));
+    for r in 0..3 {
+        for c in 0..3 {
+            assert_eq!(hat[r * 3 + c], skew[(r, c)]);
+        }
+    }
+
+    let commute = hat_commute_raw(vector);
+    for (x, y) in hat.iter().zip(commute.iter()) {
+        assert_eq!(*x, -*y);
+    }
+    approx_eq(&vee_raw(&hat), &vector, 1e-12);
+}
+
 #[test]
 fn se3_hat_and_vee_are_inverses() {
     let twist = [0.1, -0.2, 0.3, 1.0, -2.0, 3.0];
@@ -213,6 +331,59 @@ fn so3_mul_matches_compose() {
     approx_eq(&composed.apply(vector), &multiplied.apply(vector), 1e-12);
 }
 
+#[test]
+fn quaternion_apply_matches_matrix_apply() {
+    let vector = [0.5, -0.25, 1.0];
+    for (axis, angle) in [
+        ([0.3, -0.2, 0.9], 0.7),
+        ([1.0, 2.0, 3.0], 5.0),
+        ([0.0, 1.0, 0.0], 0.0),
+    ] {
+        let rotation = RustSo3::from_axis_angle(axis, angle);
+        let rotated = quaternion_apply_raw(rotation.to_quaternion(), vector);
+        approx_eq(&rotated, &rotation.apply(vector), 1e-12);
+
+        let scaled = rotation.to_quaternion().map(|c| 3.0 * c);
+        let rotated = quaternion_apply_raw(normalize_quaternion_raw(scaled), vector);
+        approx_eq(&rotated, &rotation.apply(vector), 1e-12);
+    }
+}
+
+#[test]
+fn so3_apply_many_matches_single_point_apply() {
+    let rotation = RustSo3::from_axis_angle([0.3, -0.2, 0.9], 0.7);
+    // Seven points cover both the four-wide kernel and the scalar remainder.
+    let points: Vec<f64> = (0..21).map(|i| i as f64 - 10.0).collect();
+    let rotated = rotation.apply_many(&points);
+
+    for (point, out) in points.chunks_exact(3).zip(rotated.chunks_exact(3)) {
+        let expected = rotation.apply([point[0], point[1], point[2]]);
+        approx_eq(out, &expected, 1e-12);
+    }
+}
+
+#[test]
+fn so3_compose_matches_matrix_product() {
+    let r1 = RustSo3::from_axis_angle([0.0, 0.0, 1.0], FRAC_PI_2 / 3.0);
+    let r2 = RustSo3::from_axis_angle([0.3, -1.0, 0.5], -0.7);
+
+    let expected = r1.as_matrix() * r2.as_matrix();
+    let composed = r1.compose(&r2).as_matrix();
+    for (x, y) in composed.iter().zip(expected.iter()) {
+        assert!((x - y).abs() < 1e-12, "expected {y}, got {x}");
+    }
+
+    let a = [0.1, 0.2, -0.3, 0.4, 0.5, 0.6, -0.7, 0.8, 0.9];
+    let b = [1.1, -1.2, 1.3, 1.4, 1.5, -1.6, 1.7, 1.8, 1.9];
+    let product = compose_raw(&a, &b);
+    for i in 0..3 {
+        for j in 0..3 {
+            let expected: f64 = (0..3).map(|k| a[3 * i + k] * b[3 * k + j]).sum();
+            assert!((product[3 * i + j] - expected).abs() < 1e-12);
+        }
+    }
+}
+
 #[test]
 fn se3_mul_matches_compose() {
     let r1 = RustSo3::from_axis_angle([0.0, 0.0, 1.0], FRAC_PI_2);
@@ -231,6 +402,18 @@ fn se3_mul_matches_compose() {
     approx_eq(&composed.apply(point), &multiplied.apply(point), 1e-12);
 }
 
+#[test]
+fn se3_compose_matches_homogeneous_product() {
+    let g1 = RustSe3::from_axis_angle_translation([0.0, 0.0, 1.0], 0.4, [0.5, -0.25, 0.75]);
+    let g2 = RustSe3::from_axis_angle_translation([1.0, -0.5, 0.2], -1.1, [-0.3, 0.6, 0.9]);
+
+    let expected = g1.as_matrix() * g2.as_matrix();
+    let composed = g1.compose(&g2).as_matrix();
+    for (x, y) in composed.iter().zip(expected.iter()) {
+        assert!((x - y).abs() < 1e-12, "expected {y}, got {x}");
+    }
+}
+
 #[test]
 fn cmtm_mul_matches_compose() {
     let r1 = RustSo3::from_axis_angle([0.0, 0.0, 1.0], FRAC_PI_2);
@@ -250,6 +433,25 @@ fn cmtm_mul_matches_compose() {
     }
 }
 
+#[test]
+fn spatial_cmtm_compose_matches_matrix_product() {
+    let g1 = RustSe3::from_axis_angle_translation([0.0, 0.0, 1.0], 0.5, [0.0, 0.5, -0.25]);
+    let g2 = RustSe3::from_axis_angle_translation([1.0, 0.0, 0.0], -0.8, [1.0, -0.25, 0.75]);
+    let c1 = RustCmtm::from_se3(&g1);
+    let c2 = RustCmtm::from_se3(&g2);
+
+    let expected = c1.matrix() * c2.matrix();
+    let composed = c1.compose(&c2);
+    for (x, y) in composed.matrix().iter().zip(expected.iter()) {
+        assert!((x - y).abs() < 1e-12, "expected {y}, got {x}");
+    }
+
+    let adjoint = (g1 * g2).adjoint();
+    for (x, y) in composed.matrix().iter().zip(adjoint.iter()) {
+        assert!((x - y).abs() < 1e-12, "expected {y}, got {x}");
+    }
+}
+
 #[test]
 fn se3_exp_with_pure_translation_matches_expected() {
     let twist = [0.0, 0.0, 0.0, 1.0, 2.0, 3.0];
@@ -281,3 +483,37 @@ fn se3_from_matrix_round_trip() {
     );
     approx_eq(&transform.translation(), &rebuilt.translation(), 1e-12);
 }
+
+#[test]
+fn dispatched_kernels_match_scalar_kernels_bit_for_bit() {
+    let selected = dispatch::kernels();
+    let scalar = dispatch::scalar_kernels();
+
+    let v = [0.3, -0.7, 1.1];
+    assert_eq!((selected.so3_exp)(v), (scalar.so3_exp)(v));
+
+    assert_eq!(
+        (selected.euler_zyx)(0.1, -0.2, 0.3),
+        (scalar.euler_zyx)(0.1, -0.2, 0.3)
+    );
+
+    let a = (scalar.so3_exp)(v);
+    let b = (scalar.so3_exp)([0.1, 0.2, -0.4]);
+
+    let (ta, tb) = ([1.0, 2.0, 3.0], [-1.0, 0.5, 0.25]);
+    assert_eq!(
+        (selected.se3_compose)(&a, &ta, &b, &tb),
+        (scalar.se3_compose)(&a, &ta, &b, &tb)
+    );
+
+    let m: [f64; 36] = std::array::from_fn(|i| (i as f64 * 0.7).sin());
+    let n: [f64; 36] = std::array::from_fn(|i| (i as f64 * 1.3).cos());
+    assert_eq!((selected.matmul6)(&m, &n), (scalar.matmul6)(&m, &n));
+
+    let points: Vec<f64> = (0..33).map(|i| (i as f64 * 0.37).sin()).collect();
+    let mut fast = vec![0.0; points.len()];
+    let mut reference = vec![0.0; points.len()];
+    (selected.so3_apply_many)(&a, &points, &mut fast);
+    (scalar.so3_apply_many)(&a, &points, &mut reference);
+    assert_eq!(fast, reference);
+}